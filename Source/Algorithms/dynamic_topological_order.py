@@ -0,0 +1,179 @@
+import random  # Used to generate the insertion stream in the benchmark
+import time  # Used to time insertions against full recomputation
+
+from topological_sort import CycleError, kahn_topological_sort
+
+
+class DynamicTopologicalOrder:
+    def __init__(self, vertices, edges=()):
+        """
+        Maintains a topological order of a DAG while edges are inserted (Pearce-Kelly).
+
+        Inserting u -> v when u already comes before v costs O(1). Otherwise only the affected region
+        between the two positions is searched: vertices reachable from v and vertices reaching u whose
+        positions lie in that window. Those two sets swap into the positions they jointly occupy, with
+        everything that must precede u placed first. If the forward search reaches u the edge would
+        close a cycle, so it is rejected before anything changes.
+
+        :param vertices: Number of vertices (labelled 0 .. vertices - 1)
+        :param edges: Initial edges as (u, v) pairs; must form a DAG
+        """
+        self.successors = [set() for _ in range(vertices)]
+        self.predecessors = [set() for _ in range(vertices)]
+        edges = list(edges)
+        for u, v in edges:
+            self.successors[u].add(v)
+            self.predecessors[v].add(u)
+        self.vertex_at = kahn_topological_sort(vertices, edges)  # Raises CycleError for a cyclic start
+        self.position = [0] * vertices
+        for index, vertex in enumerate(self.vertex_at):
+            self.position[vertex] = index
+
+    def add_vertex(self):
+        # Add an isolated vertex at the end of the order and return its label
+        # Time complexity: O(1)
+        vertex = len(self.position)
+        self.successors.append(set())
+        self.predecessors.append(set())
+        self.position.append(vertex)
+        self.vertex_at.append(vertex)
+        return vertex
+
+    def _search(self, start, neighbours, inside):
+        # Iterative DFS from start over vertices accepted by inside(position)
+        visited = {start}
+        stack = [start]
+        while stack:
+            vertex = stack.pop()
+            for neighbor in neighbours[vertex]:
+                if neighbor not in visited and inside(self.position[neighbor]):
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+        return visited
+
+    def _path(self, source, target, upper):
+        # Path from source to target through vertices positioned at most upper, used to report a cycle
+        parent = {source: None}
+        stack = [source]
+        while stack:
+            vertex = stack.pop()
+            if vertex == target:
+                break
+            for neighbor in self.successors[vertex]:
+                if neighbor not in parent and self.position[neighbor] <= upper:
+                    parent[neighbor] = vertex
+                    stack.append(neighbor)
+        path = []
+        while target is not None:
+            path.append(target)
+            target = parent[target]
+        return path[::-1]
+
+    def add_edge(self, u, v):
+        """
+        Inserts edge u -> v and repairs the order.
+
+        :return: Number of vertices whose position had to be reconsidered
+        :raises CycleError: if the edge would create a cycle; the structure is left unchanged
+        Time complexity: O(A log A), where A counts the vertices in the affected region and their edges
+        """
+        if u == v:
+            raise CycleError([u, u])
+        if v in self.successors[u]:
+            return 0
+        lower, upper = self.position[v], self.position[u]
+        if lower > upper:
+            self.successors[u].add(v)  # Already consistent with the order
+            self.predecessors[v].add(u)
+            return 0
+
+        # Forward from v and backward from u, both restricted to the window [lower, upper]
+        forward = self._search(v, self.successors, lambda position: position <= upper)
+        if u in forward:
+            raise CycleError(self._path(v, u, upper) + [v])  # u -> v closes the path v ~> u
+        backward = self._search(u, self.predecessors, lambda position: position >= lower)
+
+        # Reuse the positions both sets occupy: everything reaching u first, then everything reachable from v,
+        # each group keeping its current relative order
+        by_position = self.position.__getitem__
+        moved = sorted(backward, key=by_position) + sorted(forward, key=by_position)
+        slots = sorted(map(by_position, moved))
+        for vertex, slot in zip(moved, slots):
+            self.position[vertex] = slot
+            self.vertex_at[slot] = vertex
+
+        self.successors[u].add(v)
+        self.predecessors[v].add(u)
+        return len(moved)
+
+    def order(self):
+        # Current topological order as a list
+        return list(self.vertex_at)
+
+
+def benchmark_dynamic_topological_order(vertices=5_000, num_insertions=20_000, recompute_samples=20, seed=0):
+    # Average insertion cost against rerunning kahn_topological_sort after every edge
+    rng = random.Random(seed)
+    hidden = list(range(vertices))
+    rng.shuffle(hidden)  # Edges follow this hidden order, so the stream never forms a cycle
+    stream = []
+    for _ in range(num_insertions):
+        a, b = sorted(rng.sample(range(vertices), 2))
+        stream.append((hidden[a], hidden[b]))
+
+    structure = DynamicTopologicalOrder(vertices)
+    start = time.perf_counter()
+    touched = 0
+    for u, v in stream:
+        touched += structure.add_edge(u, v)
+    incremental = (time.perf_counter() - start) / num_insertions
+
+    checkpoints = [num_insertions * (i + 1) // recompute_samples for i in range(recompute_samples)]
+    start = time.perf_counter()
+    for checkpoint in checkpoints:  # Recomputing after every insertion is too slow; time evenly spaced points
+        kahn_topological_sort(vertices, stream[:checkpoint])
+    full = (time.perf_counter() - start) / recompute_samples
+
+    position = structure.position
+    valid = all(position[u] < position[v] for u, v in stream)
+    print(f"\nDynamic topological order, {vertices} vertices, {num_insertions} edge insertions:")
+    print(f"Incremental insert : {1e6 * incremental:.1f} us ({touched / num_insertions:.1f} vertices moved on average, "
+          f"valid order: {valid})")
+    print(f"Rerun kahn         : {1e6 * full:.1f} us ({full / incremental:.0f}x slower)")
+
+
+# The example is guarded so this module can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    vertices = 6
+    edges = [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]
+
+    dag = DynamicTopologicalOrder(vertices, edges)
+    print("Initial order:", dag.order())
+    dag.add_edge(0, 2)  # 0 came after 2, so the affected region is reordered
+    print("After adding 0 -> 2:", dag.order())
+    try:
+        dag.add_edge(3, 0)  # 0 -> 2 -> 3 already exists
+    except CycleError as error:
+        print(error)
+
+    benchmark_dynamic_topological_order()
+
+# -------------------------------
+# Time complexity analysis:
+# -------------------------------
+
+# 1. Initial order:
+#    - Time complexity: O(V + E), one run of Kahn's algorithm.
+
+# 2. Inserting an edge u -> v:
+#    - Time complexity: O(1) when u already precedes v.
+#    - Otherwise O(A log A), where A is the number of vertices between the positions of v and u that are reachable
+#      from v or reach u, plus their edges; the log factor comes from sorting the moved vertices.
+#      Rerunning Kahn's algorithm instead costs O(V + E) for every insertion.
+
+# 3. Cycle detection:
+#    - Time complexity: part of the forward search above; a rejected edge leaves the order unchanged.
+
+# Space complexity:
+# - Space complexity: O(V + E) for the successor and predecessor sets and the two position arrays.
@@ -1,51 +1,22 @@
-from collections import deque, defaultdict
-
-def kahn_topological_sort(vertices, edges):
-    # Create an adjacency list to represent the graph and an in-degree dictionary
-    # Time complexity: O(V), where V is the number of vertices
-    graph = defaultdict(list)  # Graph represented as adjacency list
-    in_degree = {i: 0 for i in range(vertices)}  # In-degree for each vertex
-
-    # Build the graph and compute in-degrees of each node
-    # Time complexity: O(E), where E is the number of edges
-    for u, v in edges:
-        graph[u].append(v)  # Add directed edge u -> v in the graph
-        in_degree[v] += 1  # Increment in-degree of vertex v
-
-    # Queue to store nodes with 0 in-degree (i.e., nodes with no incoming edges)
-    # Time complexity: O(V), as we iterate through all vertices
-    queue = deque([node for node in in_degree if in_degree[node] == 0])
-
-    # List to store the topological order of nodes
-    topo_order = []
-
-    # Process nodes with 0 in-degree using BFS approach
-    # Time complexity: O(V + E), where V is the number of vertices and E is the number of edges
-    while queue:
-        node = queue.popleft()  # Remove node from the queue
-        topo_order.append(node)  # Add it to the topological order
-
-        # Reduce the in-degree of all neighboring nodes
-        for neighbor in graph[node]:
-            in_degree[neighbor] -= 1  # Reduce in-degree by 1
-            # If in-degree becomes 0, add the neighbor to the queue
-            if in_degree[neighbor] == 0:
-                queue.append(neighbor)
-
-    # Check if there was a cycle in the graph by verifying if topo_order contains all vertices
-    # Time complexity: O(1), as the length check is constant time
-    if len(topo_order) != vertices:
-        return "Graph has a cycle, topological sorting not possible."
-
-    return topo_order  # Return the topological order
-
-# Example usage
-vertices = 6
-edges = [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]
-
-# Perform topological sort
-topo_sort = kahn_topological_sort(vertices, edges)
-print("Topological Order:", topo_sort)
+# Kahn's algorithm lives in topological_sort.py together with the DFS, generator and level-by-level variants
+# (the NumPy CSR variants are in topological_sort_csr.py)
+from topological_sort import CycleError, kahn_topological_sort
+
+# The example is guarded so this file can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    vertices = 6
+    edges = [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]
+
+    # Perform topological sort
+    topo_sort = kahn_topological_sort(vertices, edges)
+    print("Topological Order:", topo_sort)
+
+    # A cycle raises CycleError, which reports one offending cycle
+    try:
+        kahn_topological_sort(3, [(0, 1), (1, 2), (2, 1)])
+    except CycleError as error:
+        print(error)
 
 # -------------------------------
 # Time complexity analysis:
@@ -67,8 +38,8 @@ print("Topological Order:", topo_sort)
 #    - Worst-case: O(V + E), when we need to process all vertices and edges in the graph.
 
 # 4. Cycle detection (final check):
-#    - Time complexity: O(1), since we only compare the length of the topological order with the number of vertices.
-#    - Best, Average, and Worst-case: O(1).
+#    - Time complexity: O(1), since we only compare the number of emitted vertices with the number of vertices.
+#    - Extracting the cycle for the error costs O(V + E), and only happens when the graph is not a DAG.
 
 # Overall time complexity:
 # - Best-case time complexity: O(V + E).
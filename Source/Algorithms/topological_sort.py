@@ -0,0 +1,177 @@
+from collections import deque  # FIFO queue for Kahn's algorithm
+
+
+class CycleError(ValueError):
+    # Raised when the graph is not a DAG; the offending cycle is kept in the cycle attribute
+    def __init__(self, cycle):
+        super().__init__(f"Graph has a cycle, topological sorting not possible: {' -> '.join(map(str, cycle))}")
+        self.cycle = cycle  # Vertices of one cycle, with the first vertex repeated at the end
+
+
+def build_adjacency(vertices, edges):
+    # Adjacency list for vertices 0 .. vertices - 1 as a plain list of lists
+    # Time complexity: O(V + E)
+    graph = [[] for _ in range(vertices)]
+    for u, v in edges:
+        graph[u].append(v)  # Add directed edge u -> v
+    return graph
+
+
+def find_cycle(graph, starts=None):
+    # Return one cycle as a list of vertices (first vertex repeated at the end), or None for a DAG.
+    # graph is an adjacency list or a CSR (indptr, indices) pair; starts limits where the search begins.
+    # Time complexity: O(V + E), iterative so deep graphs do not hit the recursion limit
+    if isinstance(graph, tuple):
+        indptr, indices = graph
+        vertices = len(indptr) - 1
+        successors = lambda u: indices[indptr[u]:indptr[u + 1]].tolist()
+    else:
+        vertices = len(graph)
+        successors = graph.__getitem__
+    state = [0] * vertices  # 0 = unvisited, 1 = on the current DFS path, 2 = finished
+    for start in range(vertices) if starts is None else starts:
+        if state[start]:
+            continue
+        state[start] = 1
+        path = [start]
+        iterators = [iter(successors(start))]
+        while iterators:
+            for neighbor in iterators[-1]:
+                if state[neighbor] == 1:
+                    return path[path.index(neighbor):] + [neighbor]  # Back edge closes a cycle
+                if state[neighbor] == 0:
+                    state[neighbor] = 1
+                    path.append(neighbor)
+                    iterators.append(iter(successors(neighbor)))
+                    break
+            else:
+                state[path.pop()] = 2  # All successors done
+                iterators.pop()
+    return None
+
+
+def iter_kahn(vertices, edges):
+    # Kahn's algorithm as a generator: each vertex is yielded as soon as all its predecessors have been,
+    # so consumers can start working before the whole order is known.
+    # Raises CycleError once no vertex is left with in-degree 0 but some have not been yielded.
+    # Time complexity: O(V + E)
+    graph = build_adjacency(vertices, edges)
+    in_degree = [0] * vertices
+    for successors in graph:
+        for v in successors:
+            in_degree[v] += 1
+
+    queue = deque(node for node in range(vertices) if in_degree[node] == 0)
+    emitted = 0
+    while queue:
+        node = queue.popleft()
+        emitted += 1
+        yield node
+        for neighbor in graph[node]:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+
+    if emitted != vertices:
+        # Every vertex left over lies on or behind a cycle; search only among those
+        raise CycleError(find_cycle(graph, (node for node in range(vertices) if in_degree[node] > 0)))
+
+
+def kahn_topological_sort(vertices, edges):
+    # Topological order as a list using Kahn's algorithm; raises CycleError if the graph has a cycle
+    # Time complexity: O(V + E)
+    return list(iter_kahn(vertices, edges))
+
+
+def topological_generations(vertices, edges):
+    # Yield the vertices level by level: every vertex in a generation depends only on earlier generations,
+    # so all vertices of one generation can be processed in parallel
+    # Time complexity: O(V + E)
+    graph = build_adjacency(vertices, edges)
+    in_degree = [0] * vertices
+    for successors in graph:
+        for v in successors:
+            in_degree[v] += 1
+
+    generation = [node for node in range(vertices) if in_degree[node] == 0]
+    emitted = 0
+    while generation:
+        yield generation
+        emitted += len(generation)
+        next_generation = []
+        for node in generation:
+            for neighbor in graph[node]:
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    next_generation.append(neighbor)
+        generation = next_generation
+
+    if emitted != vertices:
+        raise CycleError(find_cycle(graph, (node for node in range(vertices) if in_degree[node] > 0)))
+
+
+def topological_sort(vertices, edges):
+    # Topological order using an iterative depth-first search; raises CycleError if the graph has a cycle
+    # Time complexity: O(V + E)
+    graph = build_adjacency(vertices, edges)
+    state = [0] * vertices  # 0 = unvisited, 1 = on the current DFS path, 2 = finished
+    finished = []  # Vertices in order of completion (reverse topological order)
+
+    for start in range(vertices):
+        if state[start]:
+            continue
+        state[start] = 1
+        path = [start]
+        iterators = [iter(graph[start])]
+        while iterators:
+            for neighbor in iterators[-1]:
+                if state[neighbor] == 1:
+                    raise CycleError(path[path.index(neighbor):] + [neighbor])
+                if state[neighbor] == 0:
+                    state[neighbor] = 1
+                    path.append(neighbor)
+                    iterators.append(iter(graph[neighbor]))
+                    break
+            else:
+                node = path.pop()  # Every successor of node is finished, so node can be finished too
+                state[node] = 2
+                finished.append(node)
+                iterators.pop()
+
+    return finished[::-1]  # Time complexity: O(V)
+
+
+# The example is guarded so this module can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    vertices = 6
+    edges = [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]
+
+    print("Topological Order (Kahn's Algorithm):", kahn_topological_sort(vertices, edges))
+    print("Topological Order (DFS-based):", topological_sort(vertices, edges))
+    print("Generations:", list(topological_generations(vertices, edges)))
+
+    try:
+        kahn_topological_sort(3, [(0, 1), (1, 2), (2, 1)])
+    except CycleError as error:
+        print(error, "- cycle:", error.cycle)
+
+# -------------------------------
+# Time complexity analysis:
+# -------------------------------
+
+# 1. Building the adjacency list and in-degrees:
+#    - Time complexity: O(V + E).
+
+# 2. Kahn's algorithm (iter_kahn, kahn_topological_sort, topological_generations):
+#    - Time complexity: O(V + E), as each vertex is queued once and each edge lowers one in-degree once.
+#    - The generator form yields every vertex as soon as it is ready instead of after the whole sort.
+
+# 3. Iterative DFS (topological_sort):
+#    - Time complexity: O(V + E), with an explicit stack of successor iterators instead of recursion.
+
+# 4. Cycle extraction (find_cycle):
+#    - Time complexity: O(V + E), run only when the sort fails and only from the vertices left over.
+
+# Space complexity:
+# - Space complexity: O(V + E) for the adjacency lists, the in-degrees and the output order.
@@ -1,3 +1,7 @@
+import time  # Used to time the benchmark runs
+
+import numpy as np  # Rolling DP row updated with vectorized operations
+
 def knapsack(values, weights, capacity):
     n = len(values)  # Number of items
 
@@ -24,13 +28,341 @@ def knapsack(values, weights, capacity):
     # The maximum value is in the bottom-right corner of the DP array
     return dp[n][capacity]  # Return the maximum value achievable with 'n' items and 'capacity' weight
 
-# Example usage
-values = [60, 100, 120]  # Values of the items
-weights = [10, 20, 30]   # Weights of the items
-capacity = 50            # Capacity of the knapsack
 
-max_value = knapsack(values, weights, capacity)
-print(f"Maximum value achievable: {max_value}")
+def knapsack_numpy(values, weights, capacity, return_items=False):
+    """
+    0/1 knapsack with a single rolling NumPy row instead of the full (n + 1) x (capacity + 1) table.
+
+    Each item updates the whole row in one vectorized step: dp[w:] = max(dp[w:], dp[:-w] + value).
+    The right-hand side is evaluated into a temporary before it is written, which is what makes the
+    in-place update read the previous item's row (the 0/1 rule) rather than the current one.
+
+    :param values: List of item values
+    :param weights: List of non-negative integer item weights
+    :param capacity: Knapsack capacity
+    :param return_items: Also return the chosen item indices; the decisions are kept as one packed bit
+                         row per item, i.e. n * (capacity + 1) / 8 bytes
+    :return: Maximum value, or (maximum value, sorted list of chosen item indices) if return_items is set
+    """
+    dtype = np.int64 if all(isinstance(value, (int, np.integer)) for value in values) else np.float64
+    dp = np.zeros(capacity + 1, dtype=dtype)  # dp[w] = best value with total weight at most w
+    decisions = []  # decisions[i] = packed bits: was item i taken at capacity w?
+
+    # Time complexity: O(n * capacity) arithmetic, in n vectorized steps
+    for value, weight in zip(values, weights):
+        if weight > capacity:
+            if return_items:
+                decisions.append(None)  # Never fits
+            continue
+        candidate = dp[:capacity + 1 - weight] + value  # Take the item: previous row shifted by its weight
+        if return_items:
+            taken = np.zeros(capacity + 1, dtype=bool)
+            taken[weight:] = candidate > dp[weight:]
+            decisions.append(np.packbits(taken))
+        np.maximum(dp[weight:], candidate, out=dp[weight:])
+
+    best = dp[capacity].item()
+    if not return_items:
+        return best
+
+    # Walk the decisions backwards from the full capacity
+    # Time complexity: O(n)
+    items = []
+    remaining = capacity
+    for i in range(len(decisions) - 1, -1, -1):
+        row = decisions[i]
+        if row is not None and (row[remaining >> 3] >> (7 - (remaining & 7))) & 1:
+            items.append(i)
+            remaining -= weights[i]
+    return best, items[::-1]
+
+
+def _knapsack_row(values, weights, capacity, dtype):
+    # Final rolling row for the given items: row[c] = best value with total weight at most c
+    # Time complexity: O(len(values) * capacity), Space complexity: O(capacity)
+    row = np.zeros(capacity + 1, dtype=dtype)
+    for value, weight in zip(values, weights):
+        if weight <= capacity:
+            np.maximum(row[weight:], row[:capacity + 1 - weight] + value, out=row[weight:])
+    return row
+
+
+def knapsack_items(values, weights, capacity, leaf_bits=1 << 23):
+    """
+    0/1 knapsack that also returns the chosen items, using memory linear in the capacity (Hirschberg style).
+
+    The items are split in half and a rolling row is computed for each half: forward[c] is the best value
+    of the first half within weight c, backward[c] the same for the second half. The optimum splits the
+    capacity at the c maximising forward[c] + backward[capacity - c], so both halves are solved again
+    independently with their share of the capacity. Subproblems small enough that their packed decision
+    bits fit in leaf_bits are finished with knapsack_numpy's bit-matrix reconstruction.
+
+    :param values: List of item values
+    :param weights: List of non-negative integer item weights
+    :param capacity: Knapsack capacity
+    :param leaf_bits: Largest items * (capacity + 1) subproblem solved directly with decision bits
+    :return: Tuple (maximum value, sorted list of chosen item indices)
+    """
+    dtype = np.int64 if all(isinstance(value, (int, np.integer)) for value in values) else np.float64
+    items = []
+
+    # Each level of the recursion does O(n * capacity) work in total, and the item ranges halve while the
+    # capacity is shared out, so the overall cost stays O(n * capacity) up to a small constant factor
+    def solve(low, high, capacity):
+        if high - low <= 1 or (high - low) * (capacity + 1) <= leaf_bits:
+            _, chosen = knapsack_numpy(values[low:high], weights[low:high], capacity, return_items=True)
+            items.extend(low + i for i in chosen)
+            return
+        middle = (low + high) // 2
+        forward = _knapsack_row(values[low:middle], weights[low:middle], capacity, dtype)
+        backward = _knapsack_row(values[middle:high], weights[middle:high], capacity, dtype)
+        split = int(np.argmax(forward + backward[::-1]))  # forward[c] + backward[capacity - c]
+        del forward, backward  # Only O(capacity) rows are alive at any depth
+        solve(low, middle, split)
+        solve(middle, high, capacity - split)
+
+    solve(0, len(values), capacity)
+    items.sort()
+    return sum(values[i] for i in items), items
+
+
+def knapsack_multi_constraint(values, sizes, capacities, return_items=False):
+    """
+    0/1 knapsack with several capacity constraints at once (for example weight and volume).
+
+    The rolling row becomes a rolling array with one axis per constraint: dp[w, v] is the best value with
+    total weight at most w and total volume at most v. An item of size (a, b) updates the whole array in one
+    vectorized step, dp[a:, b:] = max(dp[a:, b:], dp[:-a, :-b] + value), exactly like the one-dimensional row.
+
+    :param values: List of item values
+    :param sizes: List of per-item tuples of non-negative integer sizes, one entry per constraint
+    :param capacities: Tuple of capacities, one per constraint
+    :param return_items: Also return the chosen item indices (keeps n * prod(capacity + 1) / 8 bytes of bits)
+    :return: Maximum value, or (maximum value, sorted list of chosen item indices) if return_items is set
+    """
+    capacities = tuple(capacities)
+    dtype = np.int64 if all(isinstance(value, (int, np.integer)) for value in values) else np.float64
+    dp = np.zeros(tuple(c + 1 for c in capacities), dtype=dtype)
+    decisions = []
+
+    # Time complexity: O(n * prod(capacity + 1)) arithmetic, in n vectorized steps
+    for value, size in zip(values, sizes):
+        if any(s > c for s, c in zip(size, capacities)):
+            if return_items:
+                decisions.append(None)  # Never fits
+            continue
+        target = tuple(slice(s, None) for s in size)
+        candidate = dp[tuple(slice(0, c + 1 - s) for s, c in zip(size, capacities))] + value
+        if return_items:
+            taken = np.zeros(dp.shape, dtype=bool)
+            taken[target] = candidate > dp[target]
+            decisions.append(np.packbits(taken))
+        np.maximum(dp[target], candidate, out=dp[target])
+
+    best = dp[capacities].item()
+    if not return_items:
+        return best
+
+    # Walk the decisions backwards from the full capacities
+    # Time complexity: O(n * d), where d is the number of constraints
+    items = []
+    remaining = list(capacities)
+    for i in range(len(decisions) - 1, -1, -1):
+        row = decisions[i]
+        if row is None:
+            continue
+        flat = int(np.ravel_multi_index(tuple(remaining), dp.shape))
+        if (row[flat >> 3] >> (7 - (flat & 7))) & 1:
+            items.append(i)
+            remaining = [r - s for r, s in zip(remaining, sizes[i])]
+    return best, items[::-1]
+
+
+def _split_counts(counts):
+    # Binary splitting: a count k becomes pieces 1, 2, 4, ..., plus a remainder, so that every multiplicity
+    # 0 .. k is a sum of distinct pieces. Returns (item index, multiplicity) pairs.
+    # Time complexity: O(sum of log(count))
+    pieces = []
+    for i, count in enumerate(counts):
+        size = 1
+        while count > 0:
+            take = min(size, count)
+            pieces.append((i, take))
+            count -= take
+            size *= 2
+    return pieces
+
+
+def bounded_knapsack(values, weights, counts, capacity, return_items=False):
+    """
+    Knapsack in which item i is available counts[i] times.
+
+    Each count is split into binary pieces (1, 2, 4, ..., remainder) that act as ordinary 0/1 items, so the
+    rolling row does O(log count) updates per item instead of one per copy.
+
+    :param values: List of item values
+    :param weights: List of non-negative integer item weights
+    :param counts: List of how many copies of each item are available
+    :param capacity: Knapsack capacity
+    :param return_items: Also return how many copies of each item are taken (linear-memory reconstruction)
+    :return: Maximum value, or (maximum value, list of taken counts per item) if return_items is set
+    """
+    pieces = _split_counts(counts)
+    piece_values = [values[i] * k for i, k in pieces]
+    piece_weights = [weights[i] * k for i, k in pieces]
+    if not return_items:
+        dtype = np.int64 if all(isinstance(value, (int, np.integer)) for value in values) else np.float64
+        return _knapsack_row(piece_values, piece_weights, capacity, dtype)[capacity].item()
+
+    best, chosen = knapsack_items(piece_values, piece_weights, capacity)
+    taken = [0] * len(values)
+    for piece in chosen:
+        i, k = pieces[piece]
+        taken[i] += k
+    return best, taken
+
+
+def unbounded_knapsack(values, weights, capacity, return_items=False):
+    """
+    Knapsack in which every item can be taken any number of times.
+
+    In-place updates in increasing capacity order are what allow repeats, but they cannot be done as a single
+    slice operation. Instead the row is viewed as a matrix with one column per residue r modulo the item weight:
+    taking the item k - j times moves dp[j * weight + r] to dp[k * weight + r] with gain (k - j) * value, so
+    new[k] = k * value + max over j <= k of (dp[j] - j * value), a running maximum down each column.
+
+    :param values: List of item values
+    :param weights: List of positive integer item weights
+    :param capacity: Knapsack capacity
+    :param return_items: Also return how many copies of each item are taken
+    :return: Maximum value, or (maximum value, list of taken counts per item) if return_items is set
+    :raises ValueError: if an item with positive value has weight 0 (the value would be unbounded)
+    """
+    dtype = np.int64 if all(isinstance(value, (int, np.integer)) for value in values) else np.float64
+    dp = np.zeros(capacity + 1, dtype=dtype)
+    last = np.full(capacity + 1, -1, dtype=np.int32) if return_items else None  # Last item that improved dp[c]
+
+    # Time complexity: O(n * capacity) arithmetic, in O(n) vectorized steps
+    for i, (value, weight) in enumerate(zip(values, weights)):
+        if value <= 0 or weight > capacity:
+            continue  # Never worth taking, or never fits
+        if weight == 0:
+            raise ValueError(f"Item {i} has weight 0 and positive value: the knapsack value is unbounded")
+        rows = -(-(capacity + 1) // weight)  # Pad the row to a whole number of columns
+        gain = np.arange(rows, dtype=dtype)[:, None] * value
+        column = np.zeros(rows * weight, dtype=dtype)
+        column[:capacity + 1] = dp
+        column = column.reshape(rows, weight) - gain
+        np.maximum.accumulate(column, axis=0, out=column)
+        updated = (column + gain).ravel()[:capacity + 1]
+        if return_items:
+            last[updated > dp] = i
+        dp = updated
+
+    best = dp[capacity].item()
+    if not return_items:
+        return best
+
+    # The item that last improved dp[c] can always be the final copy: dp[c] == dp[c - weight] + value
+    # Time complexity: O(number of copies taken)
+    taken = [0] * len(values)
+    remaining = capacity
+    while last[remaining] != -1:
+        i = int(last[remaining])
+        taken[i] += 1
+        remaining -= weights[i]
+    return best, taken
+
+
+def benchmark_knapsack(num_items=200, capacities=(1_000, 10_000, 100_000, 1_000_000), seed=0):
+    # List-of-lists table against the rolling NumPy row, with and without item reconstruction
+    rng = np.random.default_rng(seed)
+    print(f"\n0/1 knapsack with {num_items} items:")
+    for capacity in capacities:
+        weights = rng.integers(1, max(2, capacity // 10), num_items).tolist()
+        values = rng.integers(1, 1_000, num_items).tolist()
+        line = f"capacity {capacity:>9}: "
+        if num_items * capacity <= 2_000_000:  # The table version is too slow beyond this
+            start = time.perf_counter()
+            expected = knapsack(values, weights, capacity)
+            line += f"table {time.perf_counter() - start:.3f}s, "
+        else:
+            expected = None
+        start = time.perf_counter()
+        best = knapsack_numpy(values, weights, capacity)
+        line += f"rolling row {time.perf_counter() - start:.3f}s, "
+        start = time.perf_counter()
+        best_with_items, items = knapsack_numpy(values, weights, capacity, return_items=True)
+        line += f"with items {time.perf_counter() - start:.3f}s"
+        start = time.perf_counter()
+        _, linear_items = knapsack_items(values, weights, capacity)
+        line += f", linear memory {time.perf_counter() - start:.3f}s"
+        consistent = best == best_with_items == sum(values[i] for i in items) == \
+            sum(values[i] for i in linear_items) and expected in (None, best) and \
+            max(sum(weights[i] for i in items), sum(weights[i] for i in linear_items)) <= capacity
+        print(line + f" (consistent: {consistent})")
+
+
+def benchmark_knapsack_variants(num_items=100, seed=0):
+    # The vectorized variants against expanding every copy into its own 0/1 item
+    rng = np.random.default_rng(seed)
+    values = rng.integers(1, 1_000, num_items).tolist()
+
+    print(f"\nKnapsack variants with {num_items} item types:")
+    weights = rng.integers(1, 200, num_items).tolist()
+    volumes = rng.integers(1, 200, num_items).tolist()
+    start = time.perf_counter()
+    best, items = knapsack_multi_constraint(values, list(zip(weights, volumes)), (2_000, 2_000), return_items=True)
+    feasible = sum(weights[i] for i in items) <= 2_000 and sum(volumes[i] for i in items) <= 2_000
+    print(f"{'weight + volume, 2000 x 2000':<30}: {time.perf_counter() - start:.3f}s "
+          f"(best value {best}, feasible: {feasible})")
+
+    capacity = 100_000
+    weights = rng.integers(100, 2_000, num_items).tolist()
+    counts = rng.integers(1, 100, num_items).tolist()
+    start = time.perf_counter()
+    best = bounded_knapsack(values, weights, counts, capacity)
+    split = time.perf_counter() - start
+    start = time.perf_counter()
+    expanded = knapsack_numpy([v for v, k in zip(values, counts) for _ in range(k)],
+                              [w for w, k in zip(weights, counts) for _ in range(k)], capacity)
+    print(f"{f'bounded, capacity {capacity}':<30}: binary splitting {split:.3f}s, one item per copy "
+          f"{time.perf_counter() - start:.3f}s (same value: {best == expanded})")
+
+    capacity = 1_000_000
+    start = time.perf_counter()
+    best = unbounded_knapsack(values, weights, capacity)
+    running = time.perf_counter() - start
+    start = time.perf_counter()
+    split = bounded_knapsack(values, weights, [capacity // w for w in weights], capacity)
+    print(f"{f'unbounded, capacity {capacity}':<30}: running maximum {running:.3f}s, binary splitting "
+          f"{time.perf_counter() - start:.3f}s (same value: {best == split})")
+
+# The example is guarded so this file can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    values = [60, 100, 120]  # Values of the items
+    weights = [10, 20, 30]   # Weights of the items
+    capacity = 50            # Capacity of the knapsack
+
+    max_value = knapsack(values, weights, capacity)
+    print(f"Maximum value achievable: {max_value}")
+
+    max_value, items = knapsack_numpy(values, weights, capacity, return_items=True)
+    print(f"Rolling NumPy row: {max_value}, items {items}")
+    max_value, items = knapsack_items(values, weights, capacity, leaf_bits=0)  # Force the divide and conquer path
+    print(f"Linear-memory reconstruction: {max_value}, items {items}")
+
+    volumes = [30, 10, 20]  # A second constraint on the same items
+    max_value, items = knapsack_multi_constraint(values, list(zip(weights, volumes)), (50, 40), return_items=True)
+    print(f"Weight and volume limits (50, 40): {max_value}, items {items}")
+    max_value, taken = bounded_knapsack(values, weights, [2, 1, 1], capacity, return_items=True)
+    print(f"At most 2, 1 and 1 copies: {max_value}, copies taken {taken}")
+    max_value, taken = unbounded_knapsack(values, weights, capacity, return_items=True)
+    print(f"Unlimited copies: {max_value}, copies taken {taken}")
+
+    benchmark_knapsack()
+    benchmark_knapsack_variants()
 
 # -------------------------------
 # Time complexity analysis:
@@ -57,3 +389,25 @@ print(f"Maximum value achievable: {max_value}")
 # Alternative optimization:
 # - We can reduce the space complexity to O(capacity) by using a 1D array instead of a 2D array, since the decision
 #   at any point depends only on the previous row in the table.
+
+# Rolling NumPy row (knapsack_numpy):
+# - Time complexity: O(n * capacity), done as n vectorized row updates instead of n * capacity interpreter steps.
+# - Space complexity: O(capacity) for the value only; O(n * capacity / 8) bytes when the packed decision bits
+#   are kept for item reconstruction.
+
+# Linear-memory reconstruction (knapsack_items):
+# - Time complexity: O(n * capacity) up to a constant factor (about twice the value-only work).
+# - Space complexity: O(capacity) for the rolling rows plus O(log n) recursion depth, instead of a full table.
+
+# Multi-constraint knapsack (knapsack_multi_constraint):
+# - Time complexity: O(n * prod(capacity_i + 1)), n vectorized updates of the d-dimensional rolling array.
+# - Space complexity: O(prod(capacity_i + 1)), plus n * prod(capacity_i + 1) / 8 bytes for item reconstruction.
+
+# Bounded knapsack (bounded_knapsack):
+# - Time complexity: O(capacity * sum of log(count_i)) after binary splitting, instead of O(capacity * sum of
+#   count_i) when every copy is a separate 0/1 item.
+# - Space complexity: O(capacity), also when the taken counts are reconstructed (via knapsack_items).
+
+# Unbounded knapsack (unbounded_knapsack):
+# - Time complexity: O(n * capacity), one running maximum over the residue columns per item.
+# - Space complexity: O(capacity), plus one int32 per capacity to reconstruct the taken counts.
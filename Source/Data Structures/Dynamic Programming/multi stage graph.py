@@ -1,3 +1,8 @@
+import time  # Used to time the benchmark runs
+
+import numpy as np  # Stage transition matrices and min-plus products
+
+
 def multi_stage_graph_shortest_path(graph, stages):
     """
     Find the shortest path in a multi-stage graph.
@@ -18,53 +23,178 @@ def multi_stage_graph_shortest_path(graph, stages):
     for j in range(len(stages[-1])):
         dp[-1][j] = 0  # The cost to reach the destination nodes is 0
 
+    # next_node[i][j] is the index in stage i + 1 of the best successor of node j in stage i
+    next_node = [[-1] * len(stage) for stage in stages]
+
     # Fill the DP table from the second-last stage to the first stage
     # Time complexity: O(n * m^2), where n is the number of stages and m is the number of nodes per stage
     for i in range(n - 2, -1, -1):  # Iterate over the stages in reverse order
         for j in range(len(stages[i])):  # For each node in the current stage
+            edges = graph.get(stages[i][j], {})
             # Find the minimum cost to reach any node in the next stage
             for k in range(len(stages[i + 1])):  # For each node in the next stage
-                if graph[stages[i][j]].get(stages[i + 1][k], INF) != INF:
-                    dp[i][j] = min(dp[i][j], graph[stages[i][j]][stages[i + 1][k]] + dp[i + 1][k])
+                cost = edges.get(stages[i + 1][k], INF) + dp[i + 1][k]
+                if cost < dp[i][j]:
+                    dp[i][j] = cost
+                    next_node[i][j] = k  # Remember the decision instead of re-deriving it later
 
     # Backtrack to find the path from the source to the destination
-    path = []
     min_cost = min(dp[0])  # Find the minimum cost from the start node
+    if min_cost == INF:
+        return INF, []  # No path through all the stages
     current_node = dp[0].index(min_cost)  # Find the starting node index
-    path.append(stages[0][current_node])  # Add the starting node to the path
+    path = [stages[0][current_node]]  # Add the starting node to the path
 
-    # Reconstruct the path by following the minimum cost decisions
-    for i in range(1, n):
-        for j in range(len(stages[i])):
-            if dp[i - 1][current_node] + graph[stages[i - 1][current_node]].get(stages[i][j], INF) == dp[i][j]:
-                path.append(stages[i][j])  # Add the next node in the path
-                current_node = j  # Move to the next node
-                break
+    # Reconstruct the path by following the stored decisions
+    # Time complexity: O(n)
+    for i in range(n - 1):
+        current_node = next_node[i][current_node]
+        path.append(stages[i + 1][current_node])  # Add the next node in the path
 
     return min_cost, path  # Return the minimum cost and the path taken
 
-# Example usage
-graph = {
-    0: {1: 2, 2: 4},   # Edges from node 0 to 1 and 2
-    1: {3: 7, 4: 1},   # Edges from node 1 to 3 and 4
-    2: {4: 3},         # Edge from node 2 to 4
-    3: {5: 1},         # Edge from node 3 to 5
-    4: {5: 5},         # Edge from node 4 to 5
-    5: {}              # Node 5 is the destination with no outgoing edges
-}
-
-# Define stages as lists of nodes
-stages = [
-    [0],      # Stage 1 (source)
-    [1, 2],   # Stage 2
-    [3, 4],   # Stage 3
-    [5]       # Stage 4 (destination)
-]
-
-# Call the function to find the shortest path
-min_cost, path = multi_stage_graph_shortest_path(graph, stages)
-print(f"Minimum cost: {min_cost}")
-print(f"Path taken: {path}")
+
+def stage_matrices(graph, stages):
+    """
+    Convert a multi-stage graph into one transition matrix per pair of consecutive stages.
+
+    :param graph: Dictionary where graph[i][j] represents the weight of the edge from node i to node j
+    :param stages: List of lists where each sublist represents nodes in that stage
+    :return: List of arrays; entry [j, k] is the weight from node j of stage i to node k of stage i + 1 (inf if absent)
+    """
+    # Time complexity: O(n * m^2) to fill the matrices, done once per graph
+    matrices = []
+    for current, following in zip(stages, stages[1:]):
+        column = {node: k for k, node in enumerate(following)}
+        matrix = np.full((len(current), len(following)), np.inf)
+        for j, node in enumerate(current):
+            for target, weight in graph.get(node, {}).items():
+                if target in column:
+                    matrix[j, column[target]] = weight
+        matrices.append(matrix)
+    return matrices
+
+
+def multi_stage_min_plus(matrices):
+    """
+    Shortest path through a multi-stage graph given as stage transition matrices, using min-plus products.
+
+    Each backward step is one vectorized min-plus product: cost[j] = min_k(W[j, k] + next_cost[k]).
+    The argmin of every step is stored, so the path is recovered exactly by following the pointers.
+
+    :param matrices: List of (m_i x m_(i+1)) arrays of edge weights, np.inf for missing edges
+    :return: Tuple (minimum cost, path) where path holds the chosen node index in every stage
+    """
+    cost = np.zeros(matrices[-1].shape[1]) if matrices else np.zeros(1)
+    pointers = []  # pointers[i][j] = best successor index of node j in stage i
+
+    # Time complexity: O(n * m^2) arithmetic, in n vectorized steps
+    for matrix in reversed(matrices):
+        candidates = matrix + cost  # Broadcasts next_cost along every row
+        best = np.argmin(candidates, axis=1)
+        cost = candidates[np.arange(len(matrix)), best]
+        pointers.append(best)
+    pointers.reverse()
+
+    current_node = int(np.argmin(cost))
+    min_cost = cost[current_node].item()
+    if min_cost == np.inf:
+        return min_cost, []
+    path = [current_node]
+    for best in pointers:  # Time complexity: O(n)
+        current_node = int(best[current_node])
+        path.append(current_node)
+    return min_cost, path
+
+
+def multi_stage_cost_streaming(matrices):
+    """
+    Minimum cost through a multi-stage graph, holding only two stages in memory.
+
+    The matrices are consumed front to back from any iterable (for example a generator that builds or loads
+    each stage on demand), so memory stays O(m^2) for one transition matrix regardless of the number of stages.
+    No path is returned; use multi_stage_min_plus when the path is needed.
+
+    :param matrices: Iterable of (m_i x m_(i+1)) arrays of edge weights, np.inf for missing edges
+    :return: The minimum cost from any first-stage node to any last-stage node
+    """
+    cost = None  # Cheapest cost from the first stage to every node of the current stage
+    # Time complexity: O(n * m^2) arithmetic, O(m^2) memory
+    for matrix in matrices:
+        if cost is None:
+            cost = np.zeros(len(matrix))
+        cost = np.min(cost[:, None] + matrix, axis=0)  # Min-plus product of a row vector and the matrix
+    return 0.0 if cost is None else cost.min().item()
+
+
+def random_stage_matrix(rows, cols, rng, density=0.5):
+    # Random transition matrix with about the given fraction of edges present
+    matrix = rng.integers(1, 100, (rows, cols)).astype(float)
+    matrix[rng.random((rows, cols)) > density] = np.inf
+    return matrix
+
+
+def benchmark_multi_stage_graph(num_stages=60, nodes_per_stage=300, seed=0):
+    # Dictionary DP against min-plus matrices and the streaming cost-only mode
+    rng = np.random.default_rng(seed)
+    matrices = [random_stage_matrix(nodes_per_stage, nodes_per_stage, rng) for _ in range(num_stages - 1)]
+    stages = [[i * nodes_per_stage + j for j in range(nodes_per_stage)] for i in range(num_stages)]
+    graph = {}
+    for i, matrix in enumerate(matrices):
+        for j, row in enumerate(matrix.tolist()):
+            graph[stages[i][j]] = {stages[i + 1][k]: weight for k, weight in enumerate(row) if weight != float('inf')}
+
+    print(f"\n{num_stages} stages with {nodes_per_stage} nodes each:")
+    start = time.perf_counter()
+    expected, path = multi_stage_graph_shortest_path(graph, stages)
+    print(f"dictionary DP     : {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    cost, indices = multi_stage_min_plus(matrices)
+    same_path_cost = sum(matrices[i][a, b] for i, (a, b) in enumerate(zip(indices, indices[1:]))) == cost
+    print(f"min-plus matrices : {time.perf_counter() - start:.3f}s (same cost: {cost == expected}, "
+          f"path matches cost: {same_path_cost})")
+    start = time.perf_counter()
+    cost = multi_stage_cost_streaming(iter(matrices))
+    print(f"streaming cost    : {time.perf_counter() - start:.3f}s (same cost: {cost == expected})")
+
+    # Streaming with generated stages: only one transition matrix exists at a time
+    stream_rng = np.random.default_rng(seed + 1)
+    start = time.perf_counter()
+    cost = multi_stage_cost_streaming(random_stage_matrix(1000, 1000, stream_rng) for _ in range(100))
+    print(f"streaming 100 stages x 1000 nodes: {time.perf_counter() - start:.3f}s (cost {cost})")
+
+
+# The example is guarded so this file can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    graph = {
+        0: {1: 2, 2: 4},   # Edges from node 0 to 1 and 2
+        1: {3: 7, 4: 1},   # Edges from node 1 to 3 and 4
+        2: {4: 3},         # Edge from node 2 to 4
+        3: {5: 1},         # Edge from node 3 to 5
+        4: {5: 5},         # Edge from node 4 to 5
+        5: {}              # Node 5 is the destination with no outgoing edges
+    }
+
+    # Define stages as lists of nodes
+    stages = [
+        [0],      # Stage 1 (source)
+        [1, 2],   # Stage 2
+        [3, 4],   # Stage 3
+        [5]       # Stage 4 (destination)
+    ]
+
+    # Call the function to find the shortest path
+    min_cost, path = multi_stage_graph_shortest_path(graph, stages)
+    print(f"Minimum cost: {min_cost}")
+    print(f"Path taken: {path}")
+
+    # The same graph as stage transition matrices
+    min_cost, indices = multi_stage_min_plus(stage_matrices(graph, stages))
+    print(f"Min-plus: cost {min_cost}, path {[stage[j] for stage, j in zip(stages, indices)]}")
+    print(f"Streaming cost: {multi_stage_cost_streaming(stage_matrices(graph, stages))}")
+
+    benchmark_multi_stage_graph()
 
 # -------------------------------
 # Time complexity analysis:
@@ -90,3 +220,11 @@ print(f"Path taken: {path}")
 # Space complexity:
 # - Space complexity: O(n * m), where n is the number of stages and m is the maximum number of nodes per stage.
 # - This is because the DP table requires space proportional to the number of stages and the number of nodes in each stage.
+
+# Min-plus matrices (multi_stage_min_plus):
+# - Time complexity: O(n * m^2), the same arithmetic as the DP table, but each stage is one vectorized step.
+# - Space complexity: O(n * m) for the argmin pointers, which recover the exact path in O(n).
+
+# Streaming mode (multi_stage_cost_streaming):
+# - Time complexity: O(n * m^2).
+# - Space complexity: O(m^2) for one transition matrix, independent of the number of stages.
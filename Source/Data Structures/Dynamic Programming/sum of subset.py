@@ -1,6 +1,11 @@
-def subset_sum(nums, target):
+import math  # Square-root spacing of the witness checkpoints
+import time  # Used to time the benchmark runs
+
+import numpy as np  # Boolean-array engine and the subset counts
+
+def subset_sum_table(nums, target):
     """
-    Determine if there is a subset of `nums` that sums up to `target`.
+    Determine if there is a subset of `nums` that sums up to `target`, with a full boolean table.
 
     :param nums: List of integers
     :param target: Target sum
@@ -32,13 +37,346 @@ def subset_sum(nums, target):
     # The result is in the bottom-right cell of the DP table
     return dp[n][target]  # Return whether there is a subset that sums to 'target'
 
-# Example usage
-nums = [3, 34, 4, 12, 5, 2]
-target = 9
 
-# Call the function and print the result
-result = subset_sum(nums, target)
-print(f"Subset with sum {target} exists: {result}")
+def subset_sum(nums, target, engine="int"):
+    """
+    Determine if there is a subset of `nums` that sums up to `target`, using a bitset of reachable sums.
+
+    Bit j of `reach` is set when some subset of the numbers seen so far sums to j, so adding a number x is a
+    single shift-and-or over the whole set: reach |= reach << x. With a Python int every machine word holds
+    64 sums and the shift runs in C, instead of one interpreter step per table cell.
+
+    :param nums: List of non-negative integers
+    :param target: Target sum
+    :param engine: "int" (a Python int used as a bitset) or "numpy" (a boolean array updated with slices)
+    :return: True if a subset with the sum of `target` exists, False otherwise
+    """
+    if target < 0:
+        return False
+    if engine == "numpy":
+        reach = np.zeros(target + 1, dtype=bool)
+        reach[0] = True
+        # Time complexity: O(n * target) byte operations in n vectorized steps
+        for x in nums:
+            if x <= target:
+                reach[x:] |= reach[:target + 1 - x]  # NumPy buffers the overlapping read, so this is the 0/1 rule
+                if reach[target]:
+                    return True
+        return bool(reach[target])
+    if engine != "int":
+        raise ValueError(f"Unknown engine: {engine}")
+
+    mask = (1 << (target + 1)) - 1  # Sums above the target can never come back down
+    reach = 1  # Only the empty sum 0 is reachable
+    # Time complexity: O(n * target / 64) word operations
+    for x in nums:
+        reach = (reach | reach << x) & mask
+        if reach >> target:
+            return True  # Stop as soon as the target is reached
+    return bool(reach >> target)  # Covers an empty nums with target 0
+
+
+def subset_sum_witness(nums, target):
+    """
+    Find one subset of `nums` that sums to `target`.
+
+    Keeping every intermediate bitset would cost n * target bits. Instead only every k-th bitset is kept
+    (k about sqrt(n)); walking back from the last item, each block of k bitsets is recomputed from its
+    checkpoint and an item is taken exactly when the current sum was not reachable without it.
+
+    :param nums: List of non-negative integers
+    :param target: Target sum
+    :return: Sorted list of indices into nums whose values sum to target, or None if there is none
+    """
+    if target < 0 or target > sum(nums):
+        return None  # Out of range; also avoids building a bitset as wide as a huge target
+    n = len(nums)
+    mask = (1 << (target + 1)) - 1
+    step = _witness_step(n)
+    checkpoints = []  # checkpoints[b] = bitset before item b * step
+
+    # Time complexity: O(n * target / 64), Space complexity: O(sqrt(n) * target) bits
+    reach = 1
+    for i, x in enumerate(nums):
+        if i % step == 0:
+            checkpoints.append(reach)
+        reach = (reach | reach << x) & mask
+    if not reach >> target & 1:
+        return None
+
+    # Walk the blocks backwards, recomputing each block's bitsets from its checkpoint
+    # Time complexity: O(n * target / 64) for the recomputation, O(n) for the walk
+    chosen = []
+    remaining = target
+    for block in range(len(checkpoints) - 1, -1, -1):
+        start = block * step
+        states = [checkpoints[block]]  # states[j] = bitset before item start + j
+        for x in nums[start:min(start + step, n) - 1]:
+            states.append((states[-1] | states[-1] << x) & mask)
+        for j in range(len(states) - 1, -1, -1):
+            if not states[j] >> remaining & 1:  # Not reachable without item start + j, so it must be taken
+                chosen.append(start + j)
+                remaining -= nums[start + j]
+    return chosen[::-1]
+
+
+def _witness_step(n):
+    # Items per checkpoint block in subset_sum_witness
+    return max(1, math.isqrt(n))
+
+
+def _witness_bits(n, target):
+    # Peak bitset memory of subset_sum_witness: every checkpoint plus one recomputed block, each target + 1 bits wide
+    step = _witness_step(n)
+    return (-(-n // step) + step) * (target + 1)
+
+
+def count_subsets(nums, target, modulus=None):
+    """
+    Count the subsets of `nums` (by index, so equal values count separately) that sum to `target`.
+
+    Counting needs a number per sum rather than a bit, so this uses an integer rolling row updated the same
+    way as the bitset: counts[x:] += counts[:-x].
+
+    :param nums: List of non-negative integers
+    :param target: Target sum
+    :param modulus: Count modulo this number (kept below 2^62); by default counts are exact, which needs
+                    Python integers once there are more than 62 numbers
+    :return: Number of subsets with the sum of `target`
+    """
+    if target < 0:
+        return 0
+    if modulus is not None:
+        dtype = np.int64
+    else:
+        dtype = np.int64 if len(nums) <= 62 else object  # At most 2^n subsets, which fits in int64 up to n = 62
+    counts = np.zeros(target + 1, dtype=dtype)
+    counts[0] = 1
+
+    # Time complexity: O(n * target) in n vectorized steps (object arrays run at Python speed per element)
+    for x in nums:
+        if x <= target:
+            counts[x:] += counts[:target + 1 - x]  # Overlapping read is buffered: each number is used once
+            if modulus is not None:
+                counts %= modulus
+    return int(counts[target])
+
+
+MAX_BITSET_BITS = 1 << 30  # Largest total size of the witness search's bitsets (128 MiB of Python ints)
+MAX_MEET_IN_THE_MIDDLE_ITEMS = 50  # Two half-sum arrays of 2^25 entries each are about 0.8 GB
+
+
+def _sum_dtype(nums, target):
+    # int64 when no half sum and no target - half sum can overflow, otherwise Python ints in an object array
+    # (exact but much slower)
+    return np.int64 if sum(abs(x) for x in nums) + abs(target) <= np.iinfo(np.int64).max else object
+
+
+def _half_sums(nums, dtype=np.int64):
+    # Sums of all 2^k subsets of nums, sorted, with the subset behind each sum.
+    # Built by doubling, position p holds the subset whose bit i is set when nums[i] is in it, so the argsort
+    # order doubles as the subset masks. Time complexity: O(2^k * k) for the sort
+    sums = np.zeros(1, dtype=dtype)
+    for x in nums:
+        sums = np.concatenate((sums, sums + x))
+    masks = np.argsort(sums, kind="stable")
+    return sums[masks], masks
+
+
+def _mask_indices(mask, offset=0):
+    # Item indices of a subset mask
+    return [offset + i for i in range(mask.bit_length()) if mask >> i & 1]
+
+
+def subset_sum_meet_in_the_middle(nums, target):
+    """
+    Find one subset of `nums` that sums to `target` by meeting in the middle; negative numbers are allowed.
+
+    Both halves of the numbers get a sorted array of all their subset sums, and a first-half sum a matches
+    when target - a occurs in the second half. The matching is done for all a at once with a binary search
+    (np.searchsorted), the vectorized form of a two-pointer walk over the two sorted arrays. The cost depends
+    on the number of values, not on the size of the target.
+
+    :param nums: List of integers (up to about MAX_MEET_IN_THE_MIDDLE_ITEMS of them)
+    :param target: Target sum
+    :return: Sorted list of indices into nums whose values sum to target, or None if there is none
+    Time complexity: O(2^(n/2) * n), Space complexity: O(2^(n/2))
+    """
+    half = len(nums) // 2
+    dtype = _sum_dtype(nums, target)  # Amounts near 2^63 would overflow int64
+    first_sums, first_masks = _half_sums(nums[:half], dtype)
+    second_sums, second_masks = _half_sums(nums[half:], dtype)
+    wanted = target - first_sums
+    positions = np.minimum(np.searchsorted(second_sums, wanted), len(second_sums) - 1)
+    hits = np.flatnonzero(second_sums[positions] == wanted)
+    if not hits.size:
+        return None
+    i = hits[0]
+    return _mask_indices(int(first_masks[i])) + _mask_indices(int(second_masks[positions[i]]), half)
+
+
+def iter_matching_subsets(nums, target):
+    """
+    Stream every subset of `nums` that sums to `target` (by index, so equal values count separately).
+
+    A two-pointer walk goes up the first half's sorted sums while coming down the second half's. When the two
+    sums meet the target, every combination of the equal-sum runs on both sides is a match. Subsets are
+    produced one at a time, so a caller can stop after the first few or count them without storing them all.
+
+    :param nums: List of integers, negative numbers allowed
+    :param target: Target sum
+    :return: Generator of sorted index lists
+    Time complexity: O(2^(n/2) * n) plus O(n) per subset produced
+    """
+    half = len(nums) // 2
+    dtype = _sum_dtype(nums, target)  # Amounts near 2^63 would overflow int64
+    first_sums, first_masks = _half_sums(nums[:half], dtype)
+    second_sums, second_masks = _half_sums(nums[half:], dtype)
+    first_sums, second_sums = first_sums.tolist(), second_sums.tolist()  # Python ints for the scalar walk
+    i, j = 0, len(second_sums) - 1
+    while i < len(first_sums) and j >= 0:
+        total = first_sums[i] + second_sums[j]
+        if total < target:
+            i += 1
+        elif total > target:
+            j -= 1
+        else:
+            # Runs of equal sums on both sides: every pairing matches
+            i_end = i
+            while i_end < len(first_sums) and first_sums[i_end] == first_sums[i]:
+                i_end += 1
+            j_start = j
+            while j_start >= 0 and second_sums[j_start] == second_sums[j]:
+                j_start -= 1
+            for a in range(i, i_end):
+                left = _mask_indices(int(first_masks[a]))
+                for b in range(j_start + 1, j + 1):
+                    yield left + _mask_indices(int(second_masks[b]), half)
+            i, j = i_end, j_start
+
+
+def choose_subset_sum_method(nums, target):
+    # Rough cost model: the bitset witness search does two passes of n shifts over sums up to the shifted target
+    # (64 sums per word), meet in the middle sorts and searches 2^(n/2) half sums (each costing a few dozen word
+    # operations). The bitset is only allowed when all of its checkpoints fit in MAX_BITSET_BITS.
+    n = len(nums)
+    shifted = target - sum(x for x in nums if x < 0)  # Target of the search over |x| (see find_subset_sum)
+    if not 0 <= shifted <= sum(abs(x) for x in nums):
+        bitset_cost = 0  # No subset can reach it, and the witness search returns without building a bitset
+    elif _witness_bits(n, shifted) <= MAX_BITSET_BITS:
+        bitset_cost = 2 * n * (shifted + 1) // 64
+    else:
+        bitset_cost = float("inf")
+    mitm_cost = 2 ** ((n + 1) // 2) * 32 if n <= MAX_MEET_IN_THE_MIDDLE_ITEMS else float("inf")
+    if bitset_cost == mitm_cost == float("inf"):
+        raise ValueError(f"Subset sum of {n} numbers with shifted target {shifted} is out of reach: the bitset search "
+                         f"needs {_witness_bits(n, shifted)} bits but at most MAX_BITSET_BITS = {MAX_BITSET_BITS}, "
+                         f"meet in the middle at most MAX_MEET_IN_THE_MIDDLE_ITEMS = {MAX_MEET_IN_THE_MIDDLE_ITEMS} "
+                         f"numbers")
+    return "bitset" if bitset_cost <= mitm_cost else "meet_in_the_middle"
+
+
+def find_subset_sum(nums, target):
+    """
+    Find one subset of `nums` that sums to `target`, picking the bitset DP or meet in the middle automatically.
+
+    The bitset only handles non-negative numbers, so a negative number x is replaced by |x| with its choice
+    flipped: leaving |x| out corresponds to taking x. That shifts the target by the sum of |x| over the
+    negative numbers, and afterwards the negative numbers' membership is flipped back.
+
+    :param nums: List of integers, negative numbers allowed
+    :param target: Target sum
+    :return: Tuple (sorted list of indices into nums, or None if there is no such subset; method used)
+    :raises ValueError: if there are too many numbers for meet in the middle and the bitsets of the witness
+                        search would not fit in MAX_BITSET_BITS (see choose_subset_sum_method)
+    """
+    method = choose_subset_sum_method(nums, target)
+    if method == "meet_in_the_middle":
+        return subset_sum_meet_in_the_middle(nums, target), method
+
+    negative = [i for i, x in enumerate(nums) if x < 0]
+    shifted = subset_sum_witness([abs(x) for x in nums], target - sum(nums[i] for i in negative))
+    if shifted is None:
+        return None, method
+    return sorted(set(shifted).symmetric_difference(negative)), method
+
+
+def benchmark_subset_sum(num_items=200, targets=(1_000, 100_000, 1_000_000, 10_000_000), seed=0):
+    # The boolean table against the two bitset engines and the witness search
+    rng = np.random.default_rng(seed)
+    print(f"\nSubset sum with {num_items} numbers:")
+    for target in targets:
+        # Even numbers only: odd targets are then unreachable, so the search has to run over every number
+        nums = (2 * rng.integers(1, max(2, 2 * target // num_items), num_items)).tolist()
+        target |= 1
+        line = f"target {target:>9}: "
+        if len(nums) * target <= 2_000_000:  # The table version is too slow beyond this
+            start = time.perf_counter()
+            expected = subset_sum_table(nums, target)
+            line += f"table {time.perf_counter() - start:.3f}s, "
+        else:
+            expected = None
+        timings = []
+        for engine in ("int", "numpy"):
+            start = time.perf_counter()
+            found = subset_sum(nums, target, engine)
+            timings.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        witness = subset_sum_witness(nums, target - 1)
+        elapsed = time.perf_counter() - start
+        valid = witness is not None and sum(nums[i] for i in witness) == target - 1
+        print(line + f"int bitset {timings[0]:.3f}s, numpy bitset {timings[1]:.3f}s (found {found}, "
+              f"agrees: {expected in (None, found)}), witness for {target - 1} {elapsed:.3f}s (valid: {valid})")
+
+    nums = rng.integers(1, 100, 40).tolist()
+    start = time.perf_counter()
+    total = count_subsets(nums, 1_000)
+    print(f"Subsets of {len(nums)} numbers summing to 1000: {total} (counted in {time.perf_counter() - start:.3f}s)")
+
+
+def benchmark_meet_in_the_middle(sizes=(30, 40, 44), seed=0):
+    # Reconciliation-style instances: signed amounts in the billions, where a table or bitset is out of reach
+    rng = np.random.default_rng(seed)
+    print("\nSigned subset sum with targets in the billions:")
+    for n in sizes:
+        nums = rng.integers(-5 * 10**9, 5 * 10**9, n).tolist()
+        chosen = rng.choice(n, n // 3, replace=False)
+        target = sum(nums[i] for i in chosen)  # Guaranteed to have a solution
+        start = time.perf_counter()
+        subset, method = find_subset_sum(nums, target)
+        elapsed = time.perf_counter() - start
+        valid = subset is not None and sum(nums[i] for i in subset) == target
+        start = time.perf_counter()
+        matches = sum(1 for _ in iter_matching_subsets(nums, target))
+        print(f"{n} numbers: {method} {elapsed:.3f}s (valid: {valid}), all {matches} matching subsets streamed in "
+              f"{time.perf_counter() - start:.3f}s")
+
+    nums = rng.integers(-1_000, 1_000, 60).tolist()  # Small amounts: the bitset range stays small
+    start = time.perf_counter()
+    subset, method = find_subset_sum(nums, 123)
+    valid = subset is not None and sum(nums[i] for i in subset) == 123
+    print(f"60 numbers in [-1000, 1000): {method} {time.perf_counter() - start:.3f}s (valid: {valid})")
+
+# The example is guarded so this file can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    nums = [3, 34, 4, 12, 5, 2]
+    target = 9
+
+    # Call the function and print the result
+    result = subset_sum(nums, target)
+    print(f"Subset with sum {target} exists: {result}")
+
+    print("Table version agrees:", subset_sum_table(nums, target) == result)
+    print("Witness:", [nums[i] for i in subset_sum_witness(nums, target)])
+    print("Number of subsets:", count_subsets(nums, target))
+
+    signed = [3, -34, 4, 12, -5, 2]  # Negative amounts need the meet-in-the-middle or shifted bitset search
+    print("Signed witness:", find_subset_sum(signed, -29))
+    print("All signed subsets:", [[signed[i] for i in subset] for subset in iter_matching_subsets(signed, -29)])
+
+    benchmark_subset_sum()
+    benchmark_meet_in_the_middle()
 
 # -------------------------------
 # Time complexity analysis:
@@ -60,3 +398,30 @@ print(f"Subset with sum {target} exists: {result}")
 
 # Space complexity:
 # - Space complexity: O(n * target), due to the space required for the DP table of size (n+1) x (target+1).
+
+# Bitset engine (subset_sum):
+# - Time complexity: O(n * target / w), where w = 64 bits per machine word for the int engine (w = 1 byte-sized
+#   cell per step for the NumPy engine, still in vectorized steps); it stops early once the target is reachable.
+# - Space complexity: O(target) bits, a single int instead of (n+1) x (target+1) table cells.
+
+# Witness reconstruction (subset_sum_witness):
+# - Time complexity: O(n * target / w), about twice the existence check, because each block of bitsets is
+#   recomputed once from its checkpoint.
+# - Space complexity: O(sqrt(n) * target) bits for the checkpoints and one block of bitsets.
+
+# Counting subsets (count_subsets):
+# - Time complexity: O(n * target) in n vectorized steps; exact counts beyond 62 numbers use Python integers.
+# - Space complexity: O(target) counts.
+
+# Meet in the middle (subset_sum_meet_in_the_middle, iter_matching_subsets):
+# - Time complexity: O(2^(n/2) * n) for building and sorting the two half-sum arrays, independent of the target
+#   and of the sign of the numbers; the streaming walk adds O(n) per subset it produces.
+# - Space complexity: O(2^(n/2)) for the half sums and their subset masks.
+# - Sums that could leave the int64 range (sum of |x| plus |target| above 2^63 - 1) use object arrays of Python
+#   ints: the same steps, but at interpreter speed.
+
+# Dispatcher (find_subset_sum):
+# - Picks the bitset when 2 * n * (shifted target) / 64 is below the meet-in-the-middle cost 2^(n/2), so small
+#   amounts use the DP and few large amounts use meet in the middle.
+# - The bitset is only used when its peak memory (about 2 * sqrt(n) bitsets of shifted target + 1 bits) stays
+#   within MAX_BITSET_BITS; otherwise meet in the middle is used even when it is slower.
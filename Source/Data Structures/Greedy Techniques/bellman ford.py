@@ -1,3 +1,9 @@
+import random  # Used to generate the benchmark graph
+import time  # Used to time the benchmark runs
+from collections import deque  # Queue for the SPFA variants
+
+import numpy as np  # Used for the vectorized edge-relaxation passes
+
 class Graph:
     def __init__(self, vertices):
         # Initialize the graph with the number of vertices
@@ -33,24 +39,203 @@ class Graph:
         # Return the computed shortest distances
         return distances
 
-# Example usage
-g = Graph(5)  # Create a graph with 5 vertices
-# Add edges with weights
-g.add_edge(0, 1, -1)
-g.add_edge(0, 2, 4)
-g.add_edge(1, 2, 3)
-g.add_edge(1, 3, 2)
-g.add_edge(1, 4, 2)
-g.add_edge(3, 2, 5)
-g.add_edge(3, 1, 1)
-g.add_edge(4, 3, -3)
-
-source = 0  # Source vertex for the Bellman-Ford algorithm
-distances = g.bellman_ford(source)  # Find shortest distances from the source
-if distances:
-    print(f"Distances from source vertex {source}:")
-    for i in range(len(distances)):
-        print(f"Vertex {i}: {distances[i]}")
+    def bellman_ford_optimized(self, source, method="fifo"):
+        """
+        Bellman-Ford with early termination, predecessor tracking and negative-cycle extraction.
+
+        :param source: The source vertex
+        :param method: "passes" - full passes over the edge list, stopping after the first pass with no change
+                       "fifo"   - queue-based relaxation (SPFA): only re-scan vertices whose distance changed
+                       "slf"    - SPFA with the Small Label First rule (smaller labels go to the front)
+                       "numpy"  - vectorized passes over NumPy edge arrays, suited to dense edge lists
+        :return: Tuple (distances, predecessors, negative_cycle); negative_cycle is None when no negative
+                 cycle is reachable from source, otherwise the list of vertices on one such cycle in edge
+                 order (and distances/predecessors are not meaningful)
+        """
+        if not 0 <= source < self.vertices:  # Also rules out the empty graph, where SPFA would divide by zero
+            raise ValueError(f"source {source} is not a vertex of a graph with {self.vertices} vertices")
+        if method == "passes":
+            return self._bellman_ford_passes(source)
+        if method in ("fifo", "slf"):
+            return self._spfa(source, small_label_first=method == "slf")
+        if method == "numpy":
+            return self._bellman_ford_numpy(source)
+        raise ValueError("method must be 'passes', 'fifo', 'slf' or 'numpy'")
+
+    def _find_predecessor_cycle(self, predecessors):
+        # Any cycle in the predecessor graph is a negative cycle; find one in O(V)
+        owner = [-1] * self.vertices  # Which walk first reached each vertex
+        for start in range(self.vertices):
+            vertex = start
+            while vertex is not None and owner[vertex] == -1:
+                owner[vertex] = start
+                vertex = predecessors[vertex]
+            if vertex is not None and owner[vertex] == start:
+                # The walk from start closed on itself at vertex: collect the cycle
+                cycle = [vertex]
+                current = predecessors[vertex]
+                while current != vertex:
+                    cycle.append(current)
+                    current = predecessors[current]
+                return cycle[::-1]  # Predecessor links point backwards; reverse into edge order
+        return None
+
+    def _bellman_ford_passes(self, source):
+        distances = [float('inf')] * self.vertices
+        predecessors = [None] * self.vertices
+        distances[source] = 0
+
+        # Time complexity: O(V * E) worst case, O(k * E) when distances settle after k passes
+        for _ in range(self.vertices):
+            changed = False
+            for u, v, w in self.edges:
+                if distances[u] + w < distances[v]:  # inf + w stays inf, so unreachable u never relaxes
+                    distances[v] = distances[u] + w
+                    predecessors[v] = u
+                    changed = True
+            if not changed:
+                return distances, predecessors, None  # Stable: no later pass could change anything
+        # Still relaxing after |V| passes: a reachable negative cycle exists
+        return distances, predecessors, self._find_predecessor_cycle(predecessors)
+
+    def _spfa(self, source, small_label_first=False):
+        adjacency = [[] for _ in range(self.vertices)]
+        for u, v, w in self.edges:
+            adjacency[u].append((v, w))
+
+        distances = [float('inf')] * self.vertices
+        predecessors = [None] * self.vertices
+        in_queue = [False] * self.vertices
+        distances[source] = 0
+        queue = deque([source])
+        in_queue[source] = True
+        relaxations = 0
+
+        # Time complexity: O(V * E) worst case, usually close to O(E) in practice
+        while queue:
+            u = queue.popleft()
+            in_queue[u] = False
+            for v, w in adjacency[u]:
+                if distances[u] + w < distances[v]:
+                    distances[v] = distances[u] + w
+                    predecessors[v] = u
+                    relaxations += 1
+                    # Check the predecessor graph every |V| relaxations (amortized O(1) per relaxation)
+                    if relaxations % self.vertices == 0:
+                        cycle = self._find_predecessor_cycle(predecessors)
+                        if cycle:
+                            return distances, predecessors, cycle
+                    if not in_queue[v]:
+                        in_queue[v] = True
+                        if small_label_first and queue and distances[v] < distances[queue[0]]:
+                            queue.appendleft(v)  # SLF: a smaller label is likely to be final sooner
+                        else:
+                            queue.append(v)
+        return distances, predecessors, None
+
+    def _bellman_ford_numpy(self, source):
+        # Edges sorted by head vertex so each pass takes a per-vertex minimum with one reduceat call
+        edges = np.array(self.edges, dtype=float).reshape(-1, 3)
+        order = np.argsort(edges[:, 1], kind="stable")
+        tails = edges[order, 0].astype(np.int64)
+        heads = edges[order, 1].astype(np.int64)
+        weights = edges[order, 2]
+        group_starts = np.flatnonzero(np.r_[True, heads[1:] != heads[:-1]]) if len(heads) else np.empty(0, np.int64)
+        group_heads = heads[group_starts]
+
+        distances = np.full(self.vertices, np.inf)
+        predecessors = np.full(self.vertices, -1, dtype=np.int64)
+        distances[source] = 0
+
+        # Time complexity: O(k * E) NumPy work for k passes (k <= V - 1 without negative cycles)
+        for _ in range(self.vertices):
+            candidates = distances[tails] + weights  # Every edge relaxed at once
+            if not len(candidates):
+                break
+            best = np.minimum.reduceat(candidates, group_starts)  # Cheapest incoming candidate per head
+            improved = best < distances[group_heads]
+            if not improved.any():
+                break  # Stable
+            distances[group_heads[improved]] = best[improved]
+            # The predecessor is the tail of an edge achieving the new distance
+            winning = candidates == distances[heads]
+            winning &= np.isin(heads, group_heads[improved])
+            predecessors[heads[winning]] = tails[winning]
+        else:
+            # Still improving after |V| passes: let the queue-based search isolate the cycle
+            return self._spfa(source)
+
+        predecessor_list = [None if p < 0 else int(p) for p in predecessors]
+        distance_list = distances.tolist()
+        if all(isinstance(w, int) for _, _, w in self.edges):
+            # Same int distances as the other methods (sums of ints stay exact in a float64 up to 2^53)
+            distance_list = [int(d) if d != float('inf') else d for d in distance_list]
+        return distance_list, predecessor_list, None
+
+    @staticmethod
+    def get_path(predecessors, target):
+        # Rebuild the path from the source to target using the predecessor list
+        path = []
+        while target is not None:
+            path.append(target)
+            target = predecessors[target]
+        return path[::-1]
+
+def benchmark_bellman_ford(num_vertices=1000, num_edges=5000, seed=0):
+    # Compare the original |V| - 1 passes with each optimized method on a random graph
+    rng = random.Random(seed)
+    graph = Graph(num_vertices)
+    for v in range(1, num_vertices):
+        graph.add_edge(rng.randrange(v), v, rng.randint(1, 100))  # Spanning edges keep everything reachable
+    for _ in range(num_edges - num_vertices + 1):
+        graph.add_edge(rng.randrange(num_vertices), rng.randrange(num_vertices), rng.randint(-10, 100))
+    rng.shuffle(graph.edges)
+
+    print(f"\nBellman-Ford on {num_vertices} vertices and {len(graph.edges)} edges:")
+    start = time.perf_counter()
+    graph.bellman_ford(0)
+    print(f"{'bellman_ford':<24}: {time.perf_counter() - start:.4f}s")
+    for method in ("passes", "fifo", "slf", "numpy"):
+        start = time.perf_counter()
+        graph.bellman_ford_optimized(0, method)
+        print(f"{'optimized (' + method + ')':<24}: {time.perf_counter() - start:.4f}s")
+
+
+# The example is guarded so other files can load the Graph class without running it
+if __name__ == "__main__":
+    # Example usage
+    g = Graph(5)  # Create a graph with 5 vertices
+    # Add edges with weights
+    g.add_edge(0, 1, -1)
+    g.add_edge(0, 2, 4)
+    g.add_edge(1, 2, 3)
+    g.add_edge(1, 3, 2)
+    g.add_edge(1, 4, 2)
+    g.add_edge(3, 2, 5)
+    g.add_edge(3, 1, 1)
+    g.add_edge(4, 3, -3)
+
+    source = 0  # Source vertex for the Bellman-Ford algorithm
+    distances = g.bellman_ford(source)  # Find shortest distances from the source
+    if distances:
+        print(f"Distances from source vertex {source}:")
+        for i in range(len(distances)):
+            print(f"Vertex {i}: {distances[i]}")
+
+    # Optimized mode: early exit, predecessors and the path to each vertex
+    distances, predecessors, cycle = g.bellman_ford_optimized(source, method="slf")
+    print("Path from 0 to 3:", Graph.get_path(predecessors, 3), "with distance", distances[3])
+
+    # A negative cycle 1 -> 2 -> 3 -> 1 is reported as a list of vertices instead of None
+    h = Graph(4)
+    h.add_edge(0, 1, 1)
+    h.add_edge(1, 2, -2)
+    h.add_edge(2, 3, 1)
+    h.add_edge(3, 1, -1)
+    _, _, cycle = h.bellman_ford_optimized(0)
+    print("Negative cycle:", cycle)
+
+    benchmark_bellman_ford()
 
 # -------------------------------
 # Time complexity analysis:
@@ -76,3 +261,10 @@ if distances:
 # Space complexity:
 # - Space complexity: O(V), as we store the distances for each vertex.
 # - The graph structure (edges list) takes O(E) space, where E is the number of edges.
+
+# Optimized mode (bellman_ford_optimized):
+# - "passes" stops after the first pass without a change: O(k * E) for k passes, still O(V * E) worst case.
+# - "fifo"/"slf" only re-scan vertices whose distance changed; O(V * E) worst case but usually near O(E).
+#   The predecessor graph is checked for a cycle every |V| relaxations, which costs amortized O(1) per relaxation.
+# - "numpy" performs the same passes as vectorized array operations, O(k * E) work with a small constant.
+# - Space complexity: O(V + E) for distances, predecessors and the adjacency lists or edge arrays.
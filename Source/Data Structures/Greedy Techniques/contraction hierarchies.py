@@ -0,0 +1,273 @@
+import heapq  # Priority queues for node ordering, witness searches and queries
+import os  # Used to measure the size of the saved index
+import pickle  # Used to persist the query index
+import random  # Used to pick benchmark queries
+import tempfile  # Scratch file for the benchmark index
+import time  # Used to time preprocessing and queries
+
+from dijkstra import dijkstra, grid_graph  # Plain Dijkstra and a road-like test graph for the benchmark
+
+
+class ContractionHierarchy:
+    def __init__(self, graph, settle_limit=60):
+        """
+        Preprocesses a directed graph into a contraction hierarchy.
+
+        Vertices are contracted one at a time in order of increasing priority, where the priority is the
+        edge difference (shortcuts added minus edges removed) plus the number of already contracted
+        neighbours. Contracting v adds a shortcut u -> w for every pair of neighbours whose shortest path
+        runs through v, unless a bounded witness search finds an equally short path avoiding v.
+
+        :param graph: Dictionary representing the adjacency list of the graph
+                      Example: {0: [(1, 4), (2, 1)], 1: [(2, 2)], 2: [(1, 2)]}
+        :param settle_limit: Maximum vertices a witness search may settle before giving up and adding the shortcut
+        """
+        self.vertices = list(graph)  # Vertex labels; internally vertices are dense integer ids
+        self.position = {vertex: i for i, vertex in enumerate(self.vertices)}
+        n = len(self.vertices)
+
+        # Remaining (uncontracted) graph as dictionaries so edges can be replaced by shorter shortcuts
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        for u in graph:
+            for neighbor, weight in graph[u]:
+                a, b = self.position[u], self.position[neighbor]
+                if a != b and weight < out_edges[a].get(b, float('inf')):
+                    out_edges[a][b] = weight  # Keep only the lightest parallel edge
+                    in_edges[b][a] = weight
+
+        self.rank = [0] * n  # Contraction order; higher rank means more important
+        self.up_forward = [[] for _ in range(n)]  # Edges u -> w with rank[w] > rank[u]
+        self.up_backward = [[] for _ in range(n)]  # Edges u -> w with rank[u] > rank[w], stored at w
+        self.middle = {}  # Shortcut (u, w) -> the contracted vertex it bypasses
+
+        contracted = [False] * n
+        contracted_neighbours = [0] * n
+
+        def witness_search(source, excluded, limit):
+            # Bounded Dijkstra in the remaining graph, skipping the vertex being contracted
+            distances = {source: 0}
+            priority_queue = [(0, source)]
+            settled = 0
+            while priority_queue and settled < settle_limit:
+                distance, u = heapq.heappop(priority_queue)
+                if distance > distances[u]:
+                    continue
+                if distance > limit:
+                    break  # Nothing further can be a witness
+                settled += 1
+                for neighbor, weight in out_edges[u].items():
+                    if neighbor == excluded:
+                        continue
+                    candidate = distance + weight
+                    if candidate < distances.get(neighbor, float('inf')):
+                        distances[neighbor] = candidate
+                        heapq.heappush(priority_queue, (candidate, neighbor))
+            return distances
+
+        def shortcuts_for(v):
+            # Shortcuts required if v were contracted now, as (u, w, weight) triples
+            shortcuts = []
+            for u, weight_in in in_edges[v].items():
+                targets = [(w, weight_in + weight_out) for w, weight_out in out_edges[v].items() if w != u]
+                if not targets:
+                    continue
+                distances = witness_search(u, v, max(weight for _, weight in targets))
+                for w, via_v in targets:
+                    if distances.get(w, float('inf')) > via_v:
+                        shortcuts.append((u, w, via_v))  # No witness: the shortcut is needed
+            return shortcuts
+
+        def priority(v):
+            edge_difference = len(shortcuts_for(v)) - len(in_edges[v]) - len(out_edges[v])
+            return edge_difference + contracted_neighbours[v]
+
+        # Node ordering with lazy updates: re-evaluate the cheapest vertex before contracting it
+        # Time complexity: O(V * d^2 * W), where d is the degree and W the cost of a bounded witness search
+        priority_queue = [(priority(v), v) for v in range(n)]
+        heapq.heapify(priority_queue)
+        order = 0
+        while priority_queue:
+            _, v = heapq.heappop(priority_queue)
+            current = priority(v)
+            if priority_queue and current > priority_queue[0][0]:
+                heapq.heappush(priority_queue, (current, v))  # Priority went up: try the new minimum first
+                continue
+
+            for u, w, weight in shortcuts_for(v):
+                if weight < out_edges[u].get(w, float('inf')):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+                    self.middle[(u, w)] = v
+
+            # Every remaining neighbour will be contracted later, so all of v's edges point upwards
+            self.rank[v] = order
+            order += 1
+            self.up_forward[v] = list(out_edges[v].items())
+            self.up_backward[v] = list(in_edges[v].items())
+            contracted[v] = True
+            for w in out_edges[v]:
+                del in_edges[w][v]
+                contracted_neighbours[w] += 1
+            for u in in_edges[v]:
+                del out_edges[u][v]
+                contracted_neighbours[u] += 1
+            out_edges[v] = {}
+            in_edges[v] = {}
+
+        # A shortcut that was later shortened is still one shortcut; load() counts the same way
+        self.shortcut_count = len(self.middle)
+
+    def query(self, source, target):
+        """
+        Computes the shortest path between two vertices with a bidirectional upward search.
+
+        :param source: The starting vertex
+        :param target: The destination vertex
+        :return: Tuple (distance, path); the path is empty and the distance infinite if target is unreachable
+        """
+        s, t = self.position[source], self.position[target]
+        if s == t:
+            return 0, [source]
+
+        distances = ({s: 0}, {t: 0})
+        predecessors = ({s: None}, {t: None})
+        queues = ([(0, s)], [(0, t)])
+        adjacency = (self.up_forward, self.up_backward)
+        best, meeting_vertex = float('inf'), None
+
+        # Both searches only climb the hierarchy; a side stops once its minimum cannot beat the best path
+        while True:
+            live = [side for side in (0, 1) if queues[side] and queues[side][0][0] < best]
+            if not live:
+                break
+            side = min(live, key=lambda i: queues[i][0][0])
+            distance, u = heapq.heappop(queues[side])
+            if distance > distances[side][u]:
+                continue  # Stale entry
+            if u in distances[1 - side] and distance + distances[1 - side][u] < best:
+                best = distance + distances[1 - side][u]
+                meeting_vertex = u
+            for neighbor, weight in adjacency[side][u]:
+                candidate = distance + weight
+                if candidate < distances[side].get(neighbor, float('inf')):
+                    distances[side][neighbor] = candidate
+                    predecessors[side][neighbor] = u
+                    heapq.heappush(queues[side], (candidate, neighbor))
+
+        if meeting_vertex is None:
+            return float('inf'), []
+
+        # Collect the hierarchy edges on the path, then expand shortcuts back into original edges
+        forward = []
+        vertex = meeting_vertex
+        while vertex is not None:
+            forward.append(vertex)
+            vertex = predecessors[0][vertex]
+        forward.reverse()
+        vertex = predecessors[1][meeting_vertex]
+        while vertex is not None:
+            forward.append(vertex)
+            vertex = predecessors[1][vertex]
+        return best, [self.vertices[v] for v in self._unpack(forward)]
+
+    def _unpack(self, path):
+        # Replace every shortcut (u, w) on the path by u -> middle -> w, recursively
+        unpacked = [path[0]]
+        for u, w in zip(path, path[1:]):
+            stack = [(u, w)]
+            while stack:
+                a, b = stack.pop()
+                via = self.middle.get((a, b))
+                if via is None:
+                    unpacked.append(b)
+                else:
+                    stack.append((via, b))  # Expanded second, so pushed first
+                    stack.append((a, via))
+        return unpacked
+
+    def save(self, path):
+        # Persist the query index (only load files you created yourself: pickle can run arbitrary code)
+        with open(path, "wb") as file:
+            pickle.dump((self.vertices, self.rank, self.up_forward, self.up_backward, self.middle),
+                        file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        # Restore an index written by save() without repeating the preprocessing
+        hierarchy = cls.__new__(cls)
+        with open(path, "rb") as file:
+            (hierarchy.vertices, hierarchy.rank, hierarchy.up_forward,
+             hierarchy.up_backward, hierarchy.middle) = pickle.load(file)
+        hierarchy.position = {vertex: i for i, vertex in enumerate(hierarchy.vertices)}
+        hierarchy.shortcut_count = len(hierarchy.middle)
+        return hierarchy
+
+
+def benchmark_contraction_hierarchy(rows=40, cols=40, queries=200):
+    # Preprocessing time, index size and query latency against running dijkstra per query
+    graph = grid_graph(rows, cols)
+    edge_count = sum(len(edges) for edges in graph.values())
+    print(f"\nContraction hierarchy on a {rows}x{cols} grid ({len(graph)} vertices, {edge_count} edges):")
+
+    start = time.perf_counter()
+    hierarchy = ContractionHierarchy(graph)
+    print(f"Preprocessing time : {time.perf_counter() - start:.2f}s ({hierarchy.shortcut_count} shortcuts)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        index_path = os.path.join(directory, "grid.ch")
+        hierarchy.save(index_path)
+        print(f"Index size         : {os.path.getsize(index_path) / 1024:.1f} KiB")
+        hierarchy = ContractionHierarchy.load(index_path)
+
+    rng = random.Random(2)
+    vertices = list(graph)
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+
+    start = time.perf_counter()
+    for source, target in pairs:
+        hierarchy.query(source, target)
+    ch_time = (time.perf_counter() - start) / queries
+
+    dijkstra_queries = pairs[:max(1, queries // 10)]  # Full Dijkstra is slow; a sample is enough
+    start = time.perf_counter()
+    for source, target in dijkstra_queries:
+        dijkstra(graph, source)[target]
+    dijkstra_time = (time.perf_counter() - start) / len(dijkstra_queries)
+
+    print(f"Query latency      : {1000 * ch_time:.3f} ms (dijkstra: {1000 * dijkstra_time:.3f} ms, "
+          f"{dijkstra_time / ch_time:.0f}x faster)")
+
+
+# The example is guarded so this file can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    graph = {
+        0: [(1, 4), (2, 1)],  # Edges from vertex 0 to vertices 1 (weight 4) and 2 (weight 1)
+        1: [(2, 2), (3, 5)],  # Edges from vertex 1 to vertices 2 (weight 2) and 3 (weight 5)
+        2: [(1, 2), (3, 1)],  # Edges from vertex 2 to vertices 1 (weight 2) and 3 (weight 1)
+        3: []                 # No edges from vertex 3 (end of the graph)
+    }
+
+    hierarchy = ContractionHierarchy(graph)  # One-off preprocessing
+    distance, path = hierarchy.query(0, 1)  # Many fast queries afterwards
+    print(f"Shortest path from 0 to 1: {path} (distance {distance})")
+
+    benchmark_contraction_hierarchy()
+
+# -------------------------------
+# Time complexity analysis:
+# -------------------------------
+
+# 1. Preprocessing (node ordering and contraction):
+#    - Time complexity: O(V * d^2 * W), where d is the typical degree at contraction time and W is the cost of a
+#      witness search bounded by settle_limit. On road networks d stays small, so this is close to linear in V.
+#    - Lazy priority updates re-evaluate a vertex only when it reaches the top of the queue.
+
+# 2. Query (bidirectional upward search):
+#    - Time complexity: O(k log k), where k is the number of vertices reachable upwards from source and target.
+#      On road networks k is typically a few hundred, independent of the graph size.
+#    - Unpacking shortcuts adds O(p), where p is the number of original edges on the path.
+
+# Space complexity:
+# - Space complexity: O(V + E + S), where S is the number of shortcuts added during preprocessing.
@@ -1,4 +1,9 @@
 import heapq  # Import heapq to use the priority queue (min-heap)
+import os  # Used to find the number of available cores
+import random  # Used to generate the benchmark graph
+import time  # Used to time the benchmark runs
+from array import array  # Compact typed arrays for the CSR representation
+from multiprocessing import Pool, shared_memory  # Worker processes and the shared graph buffers
 
 def dijkstra(graph, start):
     """
@@ -44,22 +49,340 @@ def dijkstra(graph, start):
     # Return the dictionary of shortest distances from the start vertex
     return distances
 
-# Example usage
-graph = {
-    0: [(1, 4), (2, 1)],  # Edges from vertex 0 to vertices 1 (weight 4) and 2 (weight 1)
-    1: [(2, 2), (3, 5)],  # Edges from vertex 1 to vertices 2 (weight 2) and 3 (weight 5)
-    2: [(1, 2), (3, 1)],  # Edges from vertex 2 to vertices 1 (weight 2) and 3 (weight 1)
-    3: []                 # No edges from vertex 3 (end of the graph)
-}
+def graph_to_csr(graph):
+    """
+    Converts an adjacency-list graph into CSR (compressed sparse row) arrays.
+
+    :param graph: Dictionary representing the adjacency list of the graph (same format as dijkstra)
+    :return: Tuple (vertices, indptr, indices, weights) where vertices[i] is the label of vertex i and the
+             edges of vertex i are indices[indptr[i]:indptr[i + 1]] with matching weights
+    """
+    vertices = list(graph)  # Vertex labels in a fixed order
+    position = {vertex: i for i, vertex in enumerate(vertices)}  # Label -> dense index
+    indptr = array('q', [0])  # Row pointers (int64)
+    indices = array('q')  # Neighbour indices (int64)
+    weights = array('d')  # Edge weights (float64)
+
+    # Time complexity: O(V + E)
+    for u in vertices:
+        for neighbor, weight in graph[u]:
+            indices.append(position[neighbor])
+            weights.append(weight)
+        indptr.append(len(indices))
+    return vertices, indptr, indices, weights
+
+
+def _csr_dijkstra(indptr, indices, weights, source):
+    # Dijkstra's algorithm over CSR arrays; returns an array of distances indexed by dense vertex id.
+    distances = array('d', [float('inf')]) * (len(indptr) - 1)
+    distances[source] = 0
+    priority_queue = [(0, source)]
+
+    while priority_queue:
+        current_distance, u = heapq.heappop(priority_queue)
+        if current_distance > distances[u]:
+            continue  # Stale entry
+        for edge in range(indptr[u], indptr[u + 1]):
+            neighbor = indices[edge]
+            distance = current_distance + weights[edge]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                heapq.heappush(priority_queue, (distance, neighbor))
+    return distances
+
+
+# CSR views of the shared graph inside a worker process, set once by _attach_shared_graph
+_shared_graph = None
+
+
+def _attach_shared_graph(blocks):
+    # Pool initializer: map the shared-memory blocks created by the parent (no copy, no pickling of the graph).
+    global _shared_graph
+    views = []
+    handles = []
+    for name, typecode, length in blocks:
+        block = shared_memory.SharedMemory(name=name)
+        handles.append(block)  # Keep the mapping alive for the lifetime of the worker
+        views.append(block.buf.cast(typecode)[:length])
+    _shared_graph = (handles, *views)
+
+
+def _dijkstra_task(source):
+    # Worker task: run Dijkstra from one source over the shared CSR graph.
+    _, indptr, indices, weights = _shared_graph
+    return source, _csr_dijkstra(indptr, indices, weights, source)
+
+
+def _distances_dict(vertices, distances, integral):
+    # Label -> distance, turning the float64 distances back into ints when every edge weight is an int,
+    # so the result matches dijkstra's (sums of ints stay exact in a float64 up to 2^53)
+    if integral:
+        return {vertex: int(d) if d != float('inf') else d for vertex, d in zip(vertices, distances)}
+    return dict(zip(vertices, distances))
+
+
+def dijkstra_many(graph, sources, workers=None, chunksize=8):
+    """
+    Runs Dijkstra's algorithm from many source vertices in parallel.
+
+    The graph is converted to CSR arrays once and placed in shared memory, so every worker
+    process maps the same read-only buffers instead of receiving a pickled copy per task.
+    Results are yielded as soon as each source finishes, so the order is not the order of `sources`.
+
+    :param graph: Dictionary representing the adjacency list of the graph (same format as dijkstra)
+    :param sources: Iterable of source vertices
+    :param workers: Number of worker processes (defaults to the number of cores; 1 runs in-process)
+    :param chunksize: Number of sources handed to a worker at a time
+    :return: Generator of (source, distances) pairs, where distances has the same format as dijkstra's result
+    """
+    vertices, indptr, indices, weights = graph_to_csr(graph)
+    integral = all(isinstance(weight, int) for edges in graph.values() for _, weight in edges)
+    position = {vertex: i for i, vertex in enumerate(vertices)}
+    source_ids = [position[source] for source in sources]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        # No pool: avoid process start-up cost entirely
+        for source in source_ids:
+            yield vertices[source], _distances_dict(vertices, _csr_dijkstra(indptr, indices, weights, source), integral)
+        return
+
+    blocks = []
+    try:
+        # Copy each CSR array into its own shared-memory block
+        for data in (indptr, indices, weights):
+            block = shared_memory.SharedMemory(create=True, size=max(data.itemsize, len(data) * data.itemsize))
+            blocks.append(block)
+            block.buf[:len(data) * data.itemsize] = data.tobytes()
+        spec = [(block.name, data.typecode, len(data)) for block, data in zip(blocks, (indptr, indices, weights))]
+
+        with Pool(workers, initializer=_attach_shared_graph, initargs=(spec,)) as pool:
+            for source, distances in pool.imap_unordered(_dijkstra_task, source_ids, chunksize):
+                yield vertices[source], _distances_dict(vertices, distances, integral)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def random_graph(num_vertices, edges_per_vertex, max_weight=100, seed=0):
+    # Random directed graph in the adjacency-list format used by dijkstra
+    rng = random.Random(seed)
+    return {u: [(rng.randrange(num_vertices), rng.randint(1, max_weight)) for _ in range(edges_per_vertex)]
+            for u in range(num_vertices)}
+
+
+def benchmark_dijkstra_many(num_vertices=2000, edges_per_vertex=5, num_sources=100):
+    # Scaling of dijkstra_many from one worker up to every core, against calling dijkstra in a loop
+    graph = random_graph(num_vertices, edges_per_vertex)
+    sources = list(range(num_sources))
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, cores} | {2 ** i for i in range(cores.bit_length()) if 2 ** i <= cores})
+
+    print(f"\nDijkstra from {num_sources} sources on {num_vertices} vertices, {num_vertices * edges_per_vertex} edges:")
+    start = time.perf_counter()
+    for source in sources:
+        dijkstra(graph, source)
+    baseline = time.perf_counter() - start
+    print(f"dijkstra() loop      : {baseline:.3f}s")
+
+    for workers in worker_counts:
+        start = time.perf_counter()
+        for _ in dijkstra_many(graph, sources, workers=workers):
+            pass
+        elapsed = time.perf_counter() - start
+        print(f"dijkstra_many({workers:>2} w.): {elapsed:.3f}s  (speedup {baseline / elapsed:.2f}x)")
+
+
+def reverse_graph(graph):
+    """
+    Builds the reverse of a directed graph (every edge u -> v becomes v -> u with the same weight).
+
+    :param graph: Dictionary representing the adjacency list of the graph
+    :return: Dictionary in the same format with all edges reversed
+    """
+    reverse = {vertex: [] for vertex in graph}
+    # Time complexity: O(V + E)
+    for u in graph:
+        for neighbor, weight in graph[u]:
+            reverse.setdefault(neighbor, []).append((u, weight))
+    return reverse
+
+
+def _build_path(predecessors, vertex):
+    # Follow predecessor links back to the source and return the path in source -> vertex order
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = predecessors[vertex]
+    return path[::-1]
+
+
+def _unidirectional_search(graph, source, target, heuristic):
+    # Dijkstra / A* that stops as soon as the target is settled
+    distances = {source: 0}
+    predecessors = {source: None}
+    settled = set()
+    priority_queue = [(heuristic(source), source)]
+
+    while priority_queue:
+        _, u = heapq.heappop(priority_queue)
+        if u in settled:
+            continue  # Stale entry
+        settled.add(u)
+        if u == target:
+            return distances[u], _build_path(predecessors, u), len(settled)
+
+        current_distance = distances[u]
+        for neighbor, weight in graph[u]:
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                predecessors[neighbor] = u
+                heapq.heappush(priority_queue, (distance + heuristic(neighbor), neighbor))
+
+    return float('inf'), [], len(settled)  # Target not reachable
+
+
+def _bidirectional_search(graph, reverse, source, target):
+    # Dijkstra from both ends; stops once the two queue minima can no longer improve the best meeting point
+    distances = ({source: 0}, {target: 0})  # Forward and backward tentative distances
+    predecessors = ({source: None}, {target: None})
+    settled = (set(), set())
+    queues = ([(0, source)], [(0, target)])
+    adjacency = (graph, reverse)
+    best, meeting_edge = float('inf'), None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break  # No path through unsettled vertices can be shorter than the best one found
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1  # Expand the side with the smaller minimum
+        current_distance, u = heapq.heappop(queues[side])
+        if u in settled[side]:
+            continue  # Stale entry
+        settled[side].add(u)
+
+        other_distances = distances[1 - side]
+        for neighbor, weight in adjacency[side][u]:
+            distance = current_distance + weight
+            if distance < distances[side].get(neighbor, float('inf')):
+                distances[side][neighbor] = distance
+                predecessors[side][neighbor] = u
+                heapq.heappush(queues[side], (distance, neighbor))
+            if neighbor in other_distances and distance + other_distances[neighbor] < best:
+                best = distance + other_distances[neighbor]
+                meeting_edge = (u, neighbor) if side == 0 else (neighbor, u)  # Edge in graph direction
+
+    settled_count = len(settled[0]) + len(settled[1])
+    if meeting_edge is None:
+        return float('inf'), [], settled_count
+    tail, head = meeting_edge
+    forward_half = _build_path(predecessors[0], tail)  # source -> tail
+    backward_half = _build_path(predecessors[1], head)[::-1]  # head -> target
+    return best, forward_half + backward_half, settled_count
 
-start_vertex = 0  # Source vertex for Dijkstra's algorithm
-# Compute the shortest distances from the source vertex to all other vertices
-shortest_distances = dijkstra(graph, start_vertex)
 
-# Print the shortest distances
-print(f"Shortest distances from vertex {start_vertex}:")
-for vertex in shortest_distances:
-    print(f"Vertex {vertex}: {shortest_distances[vertex]}")
+def shortest_path(graph, source, target, method="dijkstra", heuristic=None, reverse=None):
+    """
+    Computes a single source-target shortest path.
+
+    :param graph: Dictionary representing the adjacency list of the graph (same format as dijkstra)
+    :param source: The starting vertex
+    :param target: The destination vertex
+    :param method: "dijkstra" (stop when the target is settled), "bidirectional" or "astar"
+    :param heuristic: For "astar", a function heuristic(vertex, target) returning a consistent lower bound
+                      on the remaining distance
+    :param reverse: For "bidirectional", the reversed graph; built with reverse_graph if omitted
+                    (pass it in when answering many queries on the same graph)
+    :return: Tuple (distance, path, settled) where path is the list of vertices from source to target
+             (empty if unreachable) and settled is the number of vertices the search settled
+    """
+    if source == target:
+        return 0, [source], 1
+    if method == "dijkstra":
+        return _unidirectional_search(graph, source, target, lambda vertex: 0)
+    if method == "astar":
+        if heuristic is None:
+            raise ValueError("method 'astar' requires a heuristic")
+        return _unidirectional_search(graph, source, target, lambda vertex: heuristic(vertex, target))
+    if method == "bidirectional":
+        return _bidirectional_search(graph, reverse if reverse is not None else reverse_graph(graph),
+                                     source, target)
+    raise ValueError("method must be 'dijkstra', 'bidirectional' or 'astar'")
+
+
+def grid_graph(rows, cols, max_weight=10, seed=0):
+    # Directed grid with random weights >= 1 in both directions; vertices are (row, col) tuples
+    rng = random.Random(seed)
+    graph = {}
+    for r in range(rows):
+        for c in range(cols):
+            graph[(r, c)] = [((r + dr, c + dc), rng.randint(1, max_weight))
+                             for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                             if 0 <= r + dr < rows and 0 <= c + dc < cols]
+    return graph
+
+
+def manhattan(vertex, target):
+    # Consistent A* heuristic for grid_graph, since every edge weighs at least 1
+    return abs(vertex[0] - target[0]) + abs(vertex[1] - target[1])
+
+
+def benchmark_shortest_path(rows=100, cols=100, queries=20):
+    # Average settled vertices and query time of each method against the full dijkstra run
+    graph = grid_graph(rows, cols)
+    reverse = reverse_graph(graph)
+    rng = random.Random(1)
+    pairs = [((rng.randrange(rows), rng.randrange(cols)), (rng.randrange(rows), rng.randrange(cols)))
+             for _ in range(queries)]
+
+    print(f"\nPoint-to-point queries on a {rows}x{cols} grid ({queries} random pairs):")
+    start = time.perf_counter()
+    for source, _ in pairs:
+        dijkstra(graph, source)
+    elapsed = time.perf_counter() - start
+    print(f"{'full dijkstra':<14}: {len(graph):>8.0f} settled, {1000 * elapsed / queries:7.2f} ms/query")
+
+    for method in ("dijkstra", "bidirectional", "astar"):
+        total_settled = 0
+        start = time.perf_counter()
+        for source, target in pairs:
+            _, _, settled = shortest_path(graph, source, target, method, heuristic=manhattan, reverse=reverse)
+            total_settled += settled
+        elapsed = time.perf_counter() - start
+        print(f"{method:<14}: {total_settled / queries:>8.0f} settled, {1000 * elapsed / queries:7.2f} ms/query")
+
+
+# The example is guarded so worker processes started with the "spawn" method can import this file safely
+if __name__ == "__main__":
+    # Example usage
+    graph = {
+        0: [(1, 4), (2, 1)],  # Edges from vertex 0 to vertices 1 (weight 4) and 2 (weight 1)
+        1: [(2, 2), (3, 5)],  # Edges from vertex 1 to vertices 2 (weight 2) and 3 (weight 5)
+        2: [(1, 2), (3, 1)],  # Edges from vertex 2 to vertices 1 (weight 2) and 3 (weight 1)
+        3: []                 # No edges from vertex 3 (end of the graph)
+    }
+
+    start_vertex = 0  # Source vertex for Dijkstra's algorithm
+    # Compute the shortest distances from the source vertex to all other vertices
+    shortest_distances = dijkstra(graph, start_vertex)
+
+    # Print the shortest distances
+    print(f"Shortest distances from vertex {start_vertex}:")
+    for vertex in shortest_distances:
+        print(f"Vertex {vertex}: {shortest_distances[vertex]}")
+
+    # Distances from several sources at once; results arrive as each source finishes
+    for source, distances in sorted(dijkstra_many(graph, [0, 1, 2], workers=2)):
+        print(f"From vertex {source}: {distances}")
+
+    # Single source-target query with the path and the number of settled vertices
+    for method in ("dijkstra", "bidirectional"):
+        distance, path, settled = shortest_path(graph, 0, 3, method)
+        print(f"{method}: distance {distance}, path {path}, settled {settled} vertices")
+
+    benchmark_dijkstra_many()
+    benchmark_shortest_path()
 
 # -------------------------------
 # Time complexity analysis:
@@ -87,3 +410,12 @@ for vertex in shortest_distances:
 # Space complexity:
 # - Space complexity: O(V), where V is the number of vertices.
 # - This includes the space for the distances dictionary and the priority queue.
+
+# 4. dijkstra_many:
+#    - Time complexity: O(S * (V + E) log V / P) for S sources and P workers, plus O(V + E) to build and share the CSR arrays once.
+#    - Space complexity: O(V + E) shared by all workers, plus O(V) per worker for the distances and priority queue.
+
+# 5. shortest_path:
+#    - Worst-case time complexity: O((V + E) log V), the same as dijkstra, but the search stops once the target is settled.
+#    - Bidirectional search and A* with a good heuristic typically settle only a fraction of the vertices the full run does.
+#    - Space complexity: O(V) for the distances, predecessors and priority queues.
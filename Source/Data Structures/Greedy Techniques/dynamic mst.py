@@ -0,0 +1,247 @@
+import importlib.util  # Used to load "kruskal for mst.py", whose file name is not a valid module name
+import os  # Used to locate the sibling file
+import random  # Used to generate the insertion stream in the benchmark
+import time  # Used to time insertions against full recomputation
+
+_spec = importlib.util.spec_from_file_location(
+    "kruskal_for_mst", os.path.join(os.path.dirname(os.path.abspath(__file__)), "kruskal for mst.py"))
+kruskal_for_mst = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(kruskal_for_mst)
+
+
+class DynamicMST:
+    def __init__(self, n):
+        """
+        Maintains a minimum spanning forest while edges are inserted one at a time.
+
+        The forest is stored in a link-cut tree in which every edge is a node of its own, placed between
+        its two endpoints and carrying the edge weight. Inserting u -- v either links two trees, or finds
+        the heaviest edge on the forest path from u to v and swaps it for the new edge if that is lighter
+        (the cycle property). Every operation is O(log n) amortized.
+
+        :param n: Number of vertices (labelled 0 .. n - 1)
+        """
+        self.n = n
+        # Splay tree fields, one entry per node; nodes 0 .. n - 1 are vertices, later nodes are edges
+        self.left = [-1] * n
+        self.right = [-1] * n
+        self.parent = [-1] * n  # Splay parent, or path-parent pointer when the node is a splay root
+        self.flip = [False] * n  # Lazy "reverse this subtree" flag used by make_root
+        self.weight = [float('-inf')] * n  # Vertices never win a path-maximum query
+        self.heaviest = list(range(n))  # Node with the largest weight in each splay subtree
+        self.endpoints = [None] * n  # (u, v) for edge nodes currently in the forest
+        self.free_nodes = []  # Edge nodes removed from the forest, reused by later insertions
+        self.total_weight = 0
+        self.edge_count = 0
+
+    def _is_splay_root(self, x):
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x):
+        # Apply a pending reversal to x's children
+        if self.flip[x]:
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            if left != -1:
+                self.flip[left] = not self.flip[left]
+            if right != -1:
+                self.flip[right] = not self.flip[right]
+            self.flip[x] = False
+
+    def _pull(self, x):
+        # Recompute the heaviest node of x's splay subtree from its children
+        weight, heaviest = self.weight, self.heaviest
+        best = x
+        left, right = self.left[x], self.right[x]
+        if left != -1 and weight[heaviest[left]] > weight[best]:
+            best = heaviest[left]
+        if right != -1 and weight[heaviest[right]] > weight[best]:
+            best = heaviest[right]
+        heaviest[x] = best
+
+    def _rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if not self._is_splay_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g  # Also inherits p's path-parent pointer when p was a splay root
+        if left[p] == x:
+            child = right[x]
+            left[p] = child
+            right[x] = p
+        else:
+            child = left[x]
+            right[p] = child
+            left[x] = p
+        if child != -1:
+            parent[child] = p
+        parent[p] = x
+        self._pull(p)
+        self._pull(x)
+
+    def _splay(self, x):
+        # Time complexity: O(log n) amortized
+        path = [x]
+        while not self._is_splay_root(path[-1]):
+            path.append(self.parent[path[-1]])
+        for node in reversed(path):  # Pending reversals must be applied top-down before rotating
+            self._push(node)
+        while not self._is_splay_root(x):
+            p = self.parent[x]
+            if not self._is_splay_root(p):
+                g = self.parent[p]
+                self._rotate(p if (self.left[g] == p) == (self.left[p] == x) else x)  # Zig-zig or zig-zag
+            self._rotate(x)
+
+    def _access(self, x):
+        # Make the path from the tree root to x preferred; afterwards x is the root of its splay tree
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def _make_root(self, x):
+        self._access(x)
+        self.flip[x] = not self.flip[x]  # Reverse the root path so x becomes the tree root
+
+    def _find_root(self, x):
+        self._access(x)
+        while True:
+            self._push(x)
+            if self.left[x] == -1:
+                break
+            x = self.left[x]
+        self._splay(x)  # Keeps the amortized bound
+        return x
+
+    def _link(self, x, y):
+        self._make_root(x)
+        self.parent[x] = y
+
+    def _cut(self, x, y):
+        # Remove the forest edge between adjacent nodes x and y
+        self._make_root(x)
+        self._access(y)  # The root path is exactly x, y, so x is y's left child
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._pull(y)
+
+    def _new_edge_node(self, u, v, weight):
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            self.weight[node] = weight
+            self.heaviest[node] = node
+        else:
+            node = len(self.weight)
+            for field, value in ((self.left, -1), (self.right, -1), (self.parent, -1), (self.flip, False),
+                                 (self.weight, weight), (self.heaviest, node), (self.endpoints, None)):
+                field.append(value)
+        self.endpoints[node] = (u, v)
+        self._link(node, u)
+        self._link(v, node)
+        self.total_weight += weight
+        self.edge_count += 1
+        return node
+
+    def _remove_edge_node(self, node):
+        u, v = self.endpoints[node]
+        self._cut(u, node)
+        self._cut(node, v)
+        self.endpoints[node] = None
+        self.total_weight -= self.weight[node]
+        self.edge_count -= 1
+        self.free_nodes.append(node)
+        return u, v, self.weight[node]
+
+    def connected(self, u, v):
+        # Check whether u and v are in the same tree of the forest
+        # Time complexity: O(log n) amortized
+        self._make_root(u)
+        return self._find_root(v) == u
+
+    def insert_edge(self, u, v, weight):
+        """
+        Inserts edge u -- v and updates the minimum spanning forest.
+
+        :return: Tuple (added, removed): added tells whether the new edge is in the forest, removed is the
+                 (u, v, weight) edge it replaced, or None
+        Time complexity: O(log n) amortized
+        """
+        if u == v:
+            return False, None  # A self-loop never belongs to a spanning forest
+        if not self.connected(u, v):
+            self._new_edge_node(u, v, weight)
+            return True, None
+
+        # connected() left u as the tree root; expose the u -- v path and read its heaviest edge
+        self._access(v)
+        heaviest = self.heaviest[v]
+        if self.weight[heaviest] <= weight:
+            return False, None  # The new edge would be the heaviest on its cycle
+        removed = self._remove_edge_node(heaviest)
+        self._new_edge_node(u, v, weight)
+        return True, removed
+
+    def edges(self):
+        # Current forest edges as (u, v, weight) tuples
+        return [(*ends, self.weight[node]) for node, ends in enumerate(self.endpoints) if ends is not None]
+
+
+def benchmark_dynamic_mst(n=10_000, num_insertions=100_000, recompute_samples=20, seed=0):
+    # Per-insertion cost of the link-cut structure against rerunning kruskal on the full edge list
+    rng = random.Random(seed)
+    stream = [(rng.randrange(n), rng.randrange(n), rng.randint(1, 1_000_000)) for _ in range(num_insertions)]
+
+    forest = DynamicMST(n)
+    start = time.perf_counter()
+    for u, v, weight in stream:
+        forest.insert_edge(u, v, weight)
+    incremental = (time.perf_counter() - start) / num_insertions
+
+    # Rerunning kruskal after every insertion is too slow to time in full; time it at evenly spaced points
+    checkpoints = [num_insertions * (i + 1) // recompute_samples for i in range(recompute_samples)]
+    start = time.perf_counter()
+    for checkpoint in checkpoints:
+        _, expected = kruskal_for_mst.kruskal(n, stream[:checkpoint])
+    full = (time.perf_counter() - start) / recompute_samples
+
+    print(f"\nDynamic MST, {n} vertices, {num_insertions} insertions:")
+    print(f"Incremental insert : {1e6 * incremental:.1f} us (same total weight: {forest.total_weight == expected})")
+    print(f"Rerun kruskal      : {1e6 * full:.1f} us ({full / incremental:.0f}x slower)")
+
+
+# The example is guarded so this file can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    forest = DynamicMST(4)
+    for u, v, weight in [(0, 1, 10), (0, 2, 6), (0, 3, 5), (1, 3, 15), (2, 3, 4)]:
+        added, removed = forest.insert_edge(u, v, weight)
+        print(f"Insert {u} -- {v} == {weight}: added {added}, replaced {removed}, total weight {forest.total_weight}")
+    print("Edges in the Minimum Spanning Tree:", forest.edges())
+
+    benchmark_dynamic_mst()
+
+# -------------------------------
+# Time complexity analysis:
+# -------------------------------
+
+# 1. Connectivity check, path-maximum query, link and cut:
+#    - Time complexity: O(log n) amortized each, from splaying along preferred paths of the link-cut tree.
+
+# 2. Inserting an edge:
+#    - Time complexity: O(log n) amortized: one connectivity check, one path-maximum query and at most two cuts
+#      and two links. Rerunning Kruskal instead costs O(E log E) per insertion.
+
+# Space complexity:
+# - Space complexity: O(n) for the vertices plus O(n) for the edge nodes, since the forest never holds more than
+#   n - 1 edges and removed edge nodes are reused.
@@ -0,0 +1,221 @@
+import heapq  # Priority queue for the local repairs
+import random  # Used to generate the update stream in the benchmark
+import time  # Used to time updates against full recomputation
+
+from dijkstra import dijkstra, random_graph  # Full recomputation baseline and benchmark graph
+
+
+class DynamicShortestPaths:
+    def __init__(self, graph, source):
+        """
+        Maintains single-source shortest paths under edge insertions, deletions and weight changes.
+
+        After each change only the part of the shortest-path tree that can be affected is repaired
+        (Ramalingam-Reps): a cheaper edge propagates improvements outwards from its head, while a
+        dearer or deleted tree edge invalidates the subtree below it, which is then re-attached from
+        its unaffected in-neighbours and settled with a Dijkstra restricted to that subtree.
+        Edge weights must be non-negative.
+
+        :param graph: Dictionary representing the adjacency list of the graph (same format as dijkstra)
+        :param source: The source vertex
+        """
+        self.source = source
+        vertices = set(graph) | {neighbor for u in graph for neighbor, _ in graph[u]}
+        self.out_edges = {vertex: {} for vertex in vertices}  # u -> {v: weight}
+        self.in_edges = {vertex: {} for vertex in vertices}  # v -> {u: weight}
+        for u in graph:
+            for neighbor, weight in graph[u]:
+                if neighbor != u and weight < self.out_edges[u].get(neighbor, float('inf')):
+                    self.out_edges[u][neighbor] = weight  # Keep only the lightest parallel edge
+                    self.in_edges[neighbor][u] = weight
+
+        self.distances = {vertex: float('inf') for vertex in self.out_edges}
+        self.parent = {vertex: None for vertex in self.out_edges}  # Shortest-path tree
+        self.children = {vertex: set() for vertex in self.out_edges}
+        self.distances[source] = 0
+        self._propagate([(0, source)])  # Initial full Dijkstra run
+
+    def _add_vertex(self, vertex):
+        if vertex not in self.out_edges:
+            self.out_edges[vertex] = {}
+            self.in_edges[vertex] = {}
+            self.distances[vertex] = float('inf')
+            self.parent[vertex] = None
+            self.children[vertex] = set()
+
+    def _set_parent(self, vertex, parent):
+        # Move vertex to a new position in the shortest-path tree
+        if self.parent[vertex] is not None:
+            self.children[self.parent[vertex]].discard(vertex)
+        self.parent[vertex] = parent
+        if parent is not None:
+            self.children[parent].add(vertex)
+
+    def _propagate(self, priority_queue):
+        # Dijkstra from the given (distance, vertex) entries; only vertices that improve are visited
+        heapq.heapify(priority_queue)
+        visited = 0
+        while priority_queue:
+            distance, u = heapq.heappop(priority_queue)
+            if distance > self.distances[u]:
+                continue  # Stale entry
+            visited += 1
+            for neighbor, weight in self.out_edges[u].items():
+                candidate = distance + weight
+                if candidate < self.distances[neighbor]:
+                    self.distances[neighbor] = candidate
+                    self._set_parent(neighbor, u)
+                    heapq.heappush(priority_queue, (candidate, neighbor))
+        return visited
+
+    def _edge_got_cheaper(self, u, v):
+        # Time complexity: O(A log A), where A counts the vertices whose distance improves (and their edges)
+        candidate = self.distances[u] + self.out_edges[u][v]
+        if candidate >= self.distances[v]:
+            return 0  # The tree is still optimal
+        self.distances[v] = candidate
+        self._set_parent(v, u)
+        return self._propagate([(candidate, v)])
+
+    def _tree_edge_got_dearer(self, root):
+        # Time complexity: O(A log A), where A counts the vertices in the subtree below root (and their edges)
+        affected = []
+        stack = [root]
+        while stack:  # Collect the subtree whose distances relied on the changed edge
+            vertex = stack.pop()
+            affected.append(vertex)
+            stack.extend(self.children[vertex])
+        affected_set = set(affected)
+
+        for vertex in affected:
+            self.distances[vertex] = float('inf')
+        # Re-attach each affected vertex through its best edge from outside the subtree
+        priority_queue = []
+        for vertex in affected:
+            best, best_parent = float('inf'), None
+            for u, weight in self.in_edges[vertex].items():
+                if u not in affected_set and self.distances[u] + weight < best:
+                    best, best_parent = self.distances[u] + weight, u
+            self.distances[vertex] = best
+            self._set_parent(vertex, best_parent)
+            if best_parent is not None:
+                priority_queue.append((best, vertex))
+        self._propagate(priority_queue)  # Settle the rest of the subtree in distance order
+        return len(affected)
+
+    def update_edge(self, u, v, weight):
+        """
+        Inserts edge u -> v or changes its weight, repairing the shortest paths.
+
+        :return: Number of vertices the repair had to touch
+        """
+        self._add_vertex(u)
+        self._add_vertex(v)
+        if u == v:
+            return 0
+        old_weight = self.out_edges[u].get(v, float('inf'))
+        self.out_edges[u][v] = weight
+        self.in_edges[v][u] = weight
+        if weight < old_weight:
+            return self._edge_got_cheaper(u, v)
+        if weight > old_weight and self.parent[v] == u:
+            return self._tree_edge_got_dearer(v)
+        return 0  # Non-tree edge got dearer, or nothing changed
+
+    insert_edge = update_edge
+
+    def delete_edge(self, u, v):
+        """
+        Removes edge u -> v, repairing the shortest paths.
+
+        :return: Number of vertices the repair had to touch
+        """
+        del self.out_edges[u][v]
+        del self.in_edges[v][u]
+        if self.parent[v] == u:
+            return self._tree_edge_got_dearer(v)
+        return 0  # Removing a non-tree edge never changes a distance
+
+    def path(self, target):
+        # Current shortest path from the source to target (empty if unreachable)
+        if self.distances[target] == float('inf'):
+            return []
+        path = []
+        while target is not None:
+            path.append(target)
+            target = self.parent[target]
+        return path[::-1]
+
+
+def benchmark_dynamic_shortest_paths(num_vertices=5000, edges_per_vertex=4, num_updates=500):
+    # Average update latency of the incremental structure against rerunning dijkstra after every change
+    graph = random_graph(num_vertices, edges_per_vertex, seed=4)
+    rng = random.Random(5)
+    updates = []
+    for _ in range(num_updates):
+        u = rng.randrange(num_vertices)
+        if graph[u] and rng.random() < 0.5:
+            index = rng.randrange(len(graph[u]))
+            v, _ = graph[u][index]
+            graph[u][index] = (v, rng.randint(1, 100))  # Weight change of an existing edge
+        else:
+            v = rng.randrange(num_vertices)
+            graph[u].append((v, rng.randint(1, 100)))  # New edge
+        updates.append((u, v, min(w for x, w in graph[u] if x == v)))
+    initial = random_graph(num_vertices, edges_per_vertex, seed=4)
+
+    structure = DynamicShortestPaths(initial, 0)
+    start = time.perf_counter()
+    touched = 0
+    for u, v, weight in updates:
+        touched += structure.update_edge(u, v, weight)
+    incremental = (time.perf_counter() - start) / num_updates
+
+    sample = updates[:max(1, num_updates // 20)]  # Full recomputation is slow; time a sample
+    start = time.perf_counter()
+    for _ in sample:
+        dijkstra(graph, 0)
+    full = (time.perf_counter() - start) / len(sample)
+
+    print(f"\nDynamic shortest paths, {num_vertices} vertices, {num_updates} edge updates:")
+    print(f"Incremental update : {1000 * incremental:.3f} ms ({touched / num_updates:.1f} vertices touched on average)")
+    print(f"Full dijkstra      : {1000 * full:.3f} ms ({full / incremental:.0f}x slower)")
+
+
+# The example is guarded so this file can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    graph = {
+        0: [(1, 4), (2, 1)],  # Edges from vertex 0 to vertices 1 (weight 4) and 2 (weight 1)
+        1: [(2, 2), (3, 5)],  # Edges from vertex 1 to vertices 2 (weight 2) and 3 (weight 5)
+        2: [(1, 2), (3, 1)],  # Edges from vertex 2 to vertices 1 (weight 2) and 3 (weight 1)
+        3: []                 # No edges from vertex 3 (end of the graph)
+    }
+
+    paths = DynamicShortestPaths(graph, 0)
+    print("Initial distances:", paths.distances)
+    paths.update_edge(2, 3, 10)  # Tree edge gets dearer: vertex 3 is re-attached through vertex 1
+    print("After 2 -> 3 costs 10:", paths.distances, "path to 3:", paths.path(3))
+    paths.insert_edge(0, 3, 1)  # New shortcut edge
+    print("After inserting 0 -> 3:", paths.distances, "path to 3:", paths.path(3))
+    paths.delete_edge(0, 2)  # Deleting a tree edge
+    print("After deleting 0 -> 2:", paths.distances)
+
+    benchmark_dynamic_shortest_paths()
+
+# -------------------------------
+# Time complexity analysis:
+# -------------------------------
+
+# 1. Initial computation:
+#    - Time complexity: O((V + E) log V), a regular Dijkstra run that also records the shortest-path tree.
+
+# 2. Edge gets cheaper / is inserted:
+#    - Time complexity: O(A log A), where A is the number of vertices whose distance improves plus their out-edges.
+
+# 3. Tree edge gets dearer / is deleted:
+#    - Time complexity: O(A log A), where A is the size of the subtree below the edge plus the in- and out-edges
+#      of its vertices. Changes to non-tree edges cost O(1).
+
+# Space complexity:
+# - Space complexity: O(V + E) for the in/out edge dictionaries, distances and the shortest-path tree.
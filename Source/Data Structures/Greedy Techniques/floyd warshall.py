@@ -1,3 +1,5 @@
+import time  # Used to time the benchmark runs
+
 import numpy as np
 
 def floyd_warshall(graph):
@@ -14,35 +16,167 @@ def floyd_warshall(graph):
     # Initialize the distance matrix with the given graph
     # Time complexity: O(V^2), where V is the number of vertices
     distance = np.array(graph, dtype=float)  # Copy the adjacency matrix into a distance matrix
+    candidate = np.empty_like(distance)  # Reused buffer for the paths through vertex k
 
     # Floyd-Warshall algorithm
-    # Time complexity: O(V^3), where V is the number of vertices
+    # Time complexity: O(V^3), where V is the number of vertices, as V array operations of size V^2
     for k in range(num_vertices):
-        # For each pair of vertices (i, j), check if a shorter path exists through vertex k
-        for i in range(num_vertices):
-            for j in range(num_vertices):
-                # Update distance[i][j] if a shorter path is found via vertex k
-                if distance[i][j] > distance[i][k] + distance[k][j]:
-                    distance[i][j] = distance[i][k] + distance[k][j]
+        # For every pair (i, j) at once: the path i -> k -> j is distance[i][k] + distance[k][j]
+        np.add(distance[:, k, None], distance[None, k, :], out=candidate)
+        # Keep the shorter of the current path and the path through vertex k
+        np.minimum(distance, candidate, out=distance)
 
     return distance  # Return the matrix of shortest paths
 
-# Example usage
-graph = [
-    [0, 3, float('inf'), float('inf'), float('inf'), 5],  # Edge weights from vertex 0
-    [2, 0, float('inf'), float('inf'), float('inf'), 6],  # Edge weights from vertex 1
-    [float('inf'), 7, 0, 1, float('inf'), 2],             # Edge weights from vertex 2
-    [float('inf'), float('inf'), float('inf'), 0, 3, float('inf')],  # Edge weights from vertex 3
-    [float('inf'), float('inf'), float('inf'), 2, 0, 4],  # Edge weights from vertex 4
-    [float('inf'), float('inf'), float('inf'), float('inf'), float('inf'), 0]  # Edge weights from vertex 5
-]
+def floyd_warshall_blocked(graph, block_size=64):
+    """
+    Cache-blocked Floyd-Warshall for large matrices.
+
+    The vertices are split into blocks of block_size. For each block of intermediate vertices the
+    diagonal tile is solved first, then the row and column panels through it, and finally every other
+    row band is updated one band at a time, so a band stays in cache for all block_size updates
+    instead of the whole matrix being streamed once per intermediate vertex.
+
+    :param graph: 2D list or numpy array representing the adjacency matrix (same format as floyd_warshall)
+    :param block_size: Number of intermediate vertices processed per block
+    :return: 2D numpy array representing the shortest paths between all pairs of vertices
+    """
+    distance = np.array(graph, dtype=float)
+    n = len(distance)
+    band = np.empty((block_size, n))  # Reused buffer for one row band
+
+    # Time complexity: O(V^3), with about V^3 / block_size memory traffic instead of V^3
+    for start in range(0, n, block_size):
+        block = slice(start, min(start + block_size, n))
+        rows = block.stop - block.start
+
+        # Phase 1: the diagonal tile only depends on itself
+        tile = distance[block, block]
+        for k in range(rows):
+            np.minimum(tile, tile[:, k, None] + tile[None, k, :], out=tile)
+
+        # Phase 2: the row and column panels through the block depend on the finished diagonal tile
+        row_panel = distance[block, :]
+        column_panel = distance[:, block]
+        for k in range(block.start, block.stop):
+            np.minimum(row_panel, row_panel[:, k, None] + row_panel[None, k - block.start, :], out=row_panel)
+            np.minimum(column_panel, column_panel[:, k - block.start, None] + distance[None, k, block],
+                       out=column_panel)
 
-# Compute the shortest paths between all pairs of vertices
-shortest_paths = floyd_warshall(graph)
+        # Phase 3: every other row band only reads the finished panels, one band at a time
+        for band_start in range(0, n, block_size):
+            if band_start == block.start:
+                continue  # Already final after phase 2
+            band_rows = slice(band_start, min(band_start + block_size, n))
+            target = distance[band_rows, :]
+            buffer = band[:band_rows.stop - band_rows.start]
+            for k in range(block.start, block.stop):
+                np.add(target[:, k, None], distance[None, k, :], out=buffer)
+                np.minimum(target, buffer, out=target)
 
-# Print the shortest path matrix
-print("Shortest path matrix:")
-print(shortest_paths)
+    return distance
+
+def floyd_warshall_with_paths(graph):
+    """
+    Floyd-Warshall that also records a next-hop matrix for path reconstruction.
+
+    :param graph: 2D list or numpy array representing the adjacency matrix (same format as floyd_warshall)
+    :return: Tuple (distance, next_hop) where next_hop[i][j] is the vertex after i on a shortest i -> j path
+             (-1 if j is unreachable from i)
+    """
+    distance = np.array(graph, dtype=float)
+    n = len(distance)
+    # Initially the next hop from i towards j is j itself whenever the edge exists
+    next_hop = np.where(np.isfinite(distance), np.arange(n)[None, :], -1)
+
+    # Time complexity: O(V^3)
+    for k in range(n):
+        candidate = distance[:, k, None] + distance[None, k, :]
+        improved = candidate < distance
+        np.copyto(distance, candidate, where=improved)
+        # Paths that now go through k start with the first hop towards k
+        np.copyto(next_hop, np.broadcast_to(next_hop[:, k, None], next_hop.shape), where=improved)
+
+    return distance, next_hop
+
+def reconstruct_path(next_hop, i, j):
+    """
+    Rebuilds the shortest path from i to j from a next-hop matrix.
+
+    :return: List of vertices from i to j, or an empty list if j is unreachable from i
+    """
+    if next_hop[i][j] == -1:
+        return []
+    path = [i]
+    while i != j:
+        i = int(next_hop[i][j])
+        path.append(i)
+        if len(path) > len(next_hop):
+            raise ValueError("path passes through a negative cycle")
+    return path
+
+def negative_cycle_vertices(distance):
+    """
+    Returns the vertices that lie on a negative cycle in a Floyd-Warshall result.
+
+    Every negative cycle leaves a negative value on the diagonal for at least one of its vertices, and
+    a vertex lies on a negative closed walk exactly when it can reach such a vertex and be reached back.
+    The distances of these vertices to themselves are unbounded below, so the result is empty exactly
+    when all distances in the matrix are valid.
+    """
+    negative = np.diag(distance) < 0
+    reachable = np.isfinite(distance)
+    on_cycle = (reachable[:, negative] & reachable[negative, :].T).any(axis=1)
+    return np.flatnonzero(on_cycle).tolist()
+
+def random_matrix(n, density=0.3, seed=0):
+    # Random adjacency matrix with non-negative weights for the benchmark
+    rng = np.random.default_rng(seed)
+    matrix = np.where(rng.random((n, n)) < density, rng.integers(1, 100, (n, n)).astype(float), np.inf)
+    np.fill_diagonal(matrix, 0)
+    return matrix
+
+def benchmark_floyd_warshall(sizes=(100, 250, 500), block_size=64):
+    # Pass sizes up to 4000 for the full comparison; larger sizes take minutes
+    print("\nFloyd-Warshall benchmark:")
+    print(f"{'V':>6} {'per-k':>10} {'blocked':>10} {'with paths':>12}")
+    for n in sizes:
+        matrix = random_matrix(n)
+        timings = []
+        for run in (lambda: floyd_warshall(matrix),
+                    lambda: floyd_warshall_blocked(matrix, block_size),
+                    lambda: floyd_warshall_with_paths(matrix)):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        print(f"{n:>6} {timings[0]:>9.3f}s {timings[1]:>9.3f}s {timings[2]:>11.3f}s")
+
+
+# The example is guarded so this file can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    graph = [
+        [0, 3, float('inf'), float('inf'), float('inf'), 5],  # Edge weights from vertex 0
+        [2, 0, float('inf'), float('inf'), float('inf'), 6],  # Edge weights from vertex 1
+        [float('inf'), 7, 0, 1, float('inf'), 2],             # Edge weights from vertex 2
+        [float('inf'), float('inf'), float('inf'), 0, 3, float('inf')],  # Edge weights from vertex 3
+        [float('inf'), float('inf'), float('inf'), 2, 0, 4],  # Edge weights from vertex 4
+        [float('inf'), float('inf'), float('inf'), float('inf'), float('inf'), 0]  # Edge weights from vertex 5
+    ]
+
+    # Compute the shortest paths between all pairs of vertices
+    shortest_paths = floyd_warshall(graph)
+
+    # Print the shortest path matrix
+    print("Shortest path matrix:")
+    print(shortest_paths)
+
+    # Next-hop matrix for path reconstruction
+    distance, next_hop = floyd_warshall_with_paths(graph)
+    print("Shortest path from 2 to 4:", reconstruct_path(next_hop, 2, 4), "with cost", distance[2][4])
+    print("Vertices on negative cycles:", negative_cycle_vertices(distance))
+
+    benchmark_floyd_warshall()
 
 # -------------------------------
 # Time complexity analysis:
@@ -52,9 +186,9 @@ print(shortest_paths)
 #    - Time complexity: O(V^2), where V is the number of vertices.
 #    - We copy the input graph into the distance matrix.
 
-# 2. Floyd-Warshall algorithm (triple loop):
+# 2. Floyd-Warshall algorithm (V vectorized updates):
 #    - Time complexity: O(V^3), where V is the number of vertices.
-#    - The algorithm uses three nested loops to update the shortest paths for all pairs of vertices.
+#    - For each intermediate vertex k, one NumPy operation updates all V^2 pairs, so the interpreter only runs V steps.
 #      For each pair of vertices (i, j), the algorithm checks if a shorter path exists via an intermediate vertex k.
 #      Thus, for every vertex k, the algorithm checks all pairs of vertices, resulting in O(V^3) operations.
 
@@ -65,3 +199,10 @@ print(shortest_paths)
 
 # Space complexity:
 # - Space complexity: O(V^2), since the algorithm requires a distance matrix of size V x V to store the shortest path between every pair of vertices.
+
+# Blocked variant:
+# - Same O(V^3) work, but each row band is reused for block_size intermediate vertices while it is in cache,
+#   reducing memory traffic from O(V^3) to O(V^3 / block_size).
+
+# Path variant:
+# - O(V^3) time and an extra O(V^2) next-hop matrix; reconstruct_path runs in O(path length).
@@ -1,31 +1,16 @@
-class DisjointSet:
-    def __init__(self, n):
-        # Initialize parent and rank arrays for n elements
-        self.parent = list(range(n))  # Each node is its own parent initially
-        self.rank = [0] * n  # Rank is used to keep the tree flat
-
-    def find(self, u):
-        # Find the representative (root) of the set containing u
-        # Path compression is applied here to make future operations faster
-        if self.parent[u] != u:
-            self.parent[u] = self.find(self.parent[u])  # Recursively find the root and compress the path
-        return self.parent[u]
-
-    def union(self, u, v):
-        # Union by rank: attach the smaller tree under the root of the larger tree
-        root_u = self.find(u)  # Find the root of set containing u
-        root_v = self.find(v)  # Find the root of set containing v
-
-        if root_u != root_v:
-            # Attach the tree with smaller rank under the tree with larger rank
-            if self.rank[root_u] > self.rank[root_v]:
-                self.parent[root_v] = root_u  # Attach root_v to root_u
-            elif self.rank[root_u] < self.rank[root_v]:
-                self.parent[root_u] = root_v  # Attach root_u to root_v
-            else:
-                # If ranks are the same, arbitrarily attach one tree to the other and increase rank
-                self.parent[root_v] = root_u
-                self.rank[root_u] += 1  # Increase the rank of root_u
+import importlib.util  # Used to load "disjoint_set.py", which lives outside this folder
+import os  # Used to locate the shared Disjoint Set module
+import time  # Used to time the benchmark runs
+
+import numpy as np  # Used to sort the edge weights
+
+# All Kruskal variants share the array-backed DisjointSet (path halving, union by size)
+_spec = importlib.util.spec_from_file_location("disjoint_set", os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..",
+    "Datastructures and Algorithms", "src-1", "Disjoint Set", "disjoint_set.py"))
+disjoint_set = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(disjoint_set)
+
 
 def kruskal(n, edges):
     """
@@ -36,7 +21,7 @@ def kruskal(n, edges):
     :return: A tuple containing the MST as a list of edges and the total weight of the MST
     """
     # Initialize Disjoint Set for union-find operations
-    ds = DisjointSet(n)
+    ds = disjoint_set.DisjointSet(n)
 
     # Step 1: Sort the edges by their weights
     # Time complexity: O(E log E), where E is the number of edges
@@ -49,32 +34,166 @@ def kruskal(n, edges):
     # Time complexity: O(E log V), where E is the number of edges and V is the number of vertices
     for u, v, weight in edges:
         # Check if including this edge creates a cycle using union-find
-        if ds.find(u) != ds.find(v):
+        if ds.union(u, v):
             # If it doesn't form a cycle, include this edge in the MST
-            ds.union(u, v)
             mst.append((u, v, weight))  # Add edge (u, v) to MST
             total_weight += weight  # Add the weight of the edge to the total weight
 
     # Return the MST and its total weight
     return mst, total_weight
 
-# Example usage
-edges = [
-    (0, 1, 10),  # Edge between 0 and 1 with weight 10
-    (0, 2, 6),   # Edge between 0 and 2 with weight 6
-    (0, 3, 5),   # Edge between 0 and 3 with weight 5
-    (1, 3, 15),  # Edge between 1 and 3 with weight 15
-    (2, 3, 4)    # Edge between 2 and 3 with weight 4
-]
+def kruskal_optimized(n, sources, targets, weights, chunk_size=1 << 16):
+    """
+    Kruskal's algorithm on array-backed edges, suited to edge lists with millions of entries.
+
+    Edges are ordered with np.argsort on the weight array instead of sorting Python tuples, and
+    each edge costs a single DisjointSet.union call (iterative path halving, so no recursion limit).
+    The scan stops as soon as the tree has n - 1 edges, and sorted edges are converted to Python
+    values one chunk at a time so the unused tail of the edge list is never touched.
+
+    :param n: Number of vertices
+    :param sources: Array-like of edge start vertices
+    :param targets: Array-like of edge end vertices
+    :param weights: Array-like of edge weights
+    :param chunk_size: Number of sorted edges converted to Python values at a time
+    :return: A tuple containing the MST as a list of edges (u, v, weight) and the total weight of the MST
+    """
+    sources = np.asarray(sources)
+    targets = np.asarray(targets)
+    weights = np.asarray(weights)
+
+    # Step 1: Sort the edges by weight
+    # Time complexity: O(E log E), done in NumPy
+    order = np.argsort(weights, kind="stable")
+
+    union = disjoint_set.DisjointSet(n).union  # Bound once: it is called for every scanned edge
+
+    mst = []
+    total_weight = 0
+    # Step 2: Scan edges in weight order until the tree is complete
+    # Time complexity: O(E α(V)) worst case, usually far fewer edges thanks to the early stop
+    for start in range(0, len(order), chunk_size):
+        chunk = order[start:start + chunk_size]
+        for u, v, weight in zip(sources[chunk].tolist(), targets[chunk].tolist(), weights[chunk].tolist()):
+            if not union(u, v):
+                continue  # Same component: the edge would form a cycle
+            mst.append((u, v, weight))
+            total_weight += weight
+            if len(mst) == n - 1:
+                break
+        if len(mst) == n - 1:
+            break  # Spanning tree complete: skip the remaining edges
+
+    return mst, total_weight
+
+def filter_kruskal(n, sources, targets, weights, base_size=1 << 15, seed=0):
+    """
+    Filter-Kruskal: Kruskal's algorithm with quicksort-style partitioning of the edges.
+
+    The edges are split around a pivot weight. The light part is solved first; then every heavy edge
+    whose endpoints are already connected is discarded with one vectorized find before the heavy part
+    is partitioned further. On dense or large graphs most heavy edges are filtered out and never sorted.
+
+    :param n: Number of vertices
+    :param sources: Array-like of edge start vertices
+    :param targets: Array-like of edge end vertices
+    :param weights: Array-like of edge weights
+    :param base_size: Partitions with at most this many edges are sorted and scanned directly
+    :param seed: Seed for the pivot sampling
+    :return: A tuple containing the MST as a list of edges (u, v, weight) and the total weight of the MST
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    weights = np.asarray(weights)
+    rng = np.random.default_rng(seed)
+
+    ds = disjoint_set.DisjointSet(n)  # Scalar unions in the base case, vectorized finds in the filter
+
+    mst = []
+    total_weight = 0
+    # Partitions still to process; the top of the stack always holds the lightest remaining edges
+    stack = [np.arange(len(weights))]
+
+    # Time complexity: O(E + V log V log (E / V)) expected for random weights
+    while stack and len(mst) < n - 1:
+        edges = stack.pop()
+        if not len(edges):
+            continue
+        # Filter: drop edges inside a single component (only helps once something has been joined)
+        if mst:
+            edges = edges[ds.find_many(sources[edges]) != ds.find_many(targets[edges])]
+
+        if len(edges) > base_size:
+            sample = weights[edges[rng.integers(0, len(edges), 101)]]
+            pivot = np.median(sample)
+            light = weights[edges] <= pivot
+            if 0 < np.count_nonzero(light) < len(edges):
+                stack.append(edges[~light])  # Processed after the light part
+                stack.append(edges[light])
+                continue
+            # Degenerate pivot (e.g. many equal weights): fall through to the base case
+
+        # Base case: plain Kruskal on a small partition
+        edges = edges[np.argsort(weights[edges], kind="stable")]
+        for u, v, weight in zip(sources[edges].tolist(), targets[edges].tolist(), weights[edges].tolist()):
+            if not ds.union(u, v):
+                continue
+            mst.append((u, v, weight))
+            total_weight += weight
+            if len(mst) == n - 1:
+                break
+
+    return mst, total_weight
 
-n = 4  # Number of vertices
-mst, total_weight = kruskal(n, edges)
 
-# Output the edges of the Minimum Spanning Tree
-print("Edges in the Minimum Spanning Tree:")
-for u, v, weight in mst:
-    print(f"{u} -- {v} == {weight}")
-print(f"Total weight of the Minimum Spanning Tree: {total_weight}")
+def benchmark_kruskal(n=50_000, num_edges=500_000, seed=0):
+    # Compare kruskal() on tuples with kruskal_optimized() on NumPy edge arrays
+    rng = np.random.default_rng(seed)
+    sources = rng.integers(0, n, num_edges)
+    targets = rng.integers(0, n, num_edges)
+    weights = rng.integers(1, 1_000_000, num_edges)
+    edge_list = list(zip(sources.tolist(), targets.tolist(), weights.tolist()))
+
+    print(f"\nKruskal on {n} vertices and {num_edges} edges:")
+    start = time.perf_counter()
+    _, expected = kruskal(n, edge_list)
+    print(f"kruskal           : {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    _, total = kruskal_optimized(n, sources, targets, weights)
+    print(f"kruskal_optimized : {time.perf_counter() - start:.3f}s (same total weight: {total == expected})")
+    start = time.perf_counter()
+    _, total = filter_kruskal(n, sources, targets, weights)
+    print(f"filter_kruskal    : {time.perf_counter() - start:.3f}s (same total weight: {total == expected})")
+
+
+# The example is guarded so this file can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    edges = [
+        (0, 1, 10),  # Edge between 0 and 1 with weight 10
+        (0, 2, 6),   # Edge between 0 and 2 with weight 6
+        (0, 3, 5),   # Edge between 0 and 3 with weight 5
+        (1, 3, 15),  # Edge between 1 and 3 with weight 15
+        (2, 3, 4)    # Edge between 2 and 3 with weight 4
+    ]
+
+    n = 4  # Number of vertices
+    mst, total_weight = kruskal(n, edges)
+
+    # Output the edges of the Minimum Spanning Tree
+    print("Edges in the Minimum Spanning Tree:")
+    for u, v, weight in mst:
+        print(f"{u} -- {v} == {weight}")
+    print(f"Total weight of the Minimum Spanning Tree: {total_weight}")
+
+    # The optimized version takes the edges as parallel arrays
+    sources, targets, weights = zip(*edges)
+    mst, total_weight = kruskal_optimized(n, sources, targets, weights)
+    print(f"Optimized Kruskal: {mst}, total weight {total_weight}")
+    mst, total_weight = filter_kruskal(n, sources, targets, weights)
+    print(f"Filter-Kruskal: {mst}, total weight {total_weight}")
+
+    benchmark_kruskal()
 
 # -------------------------------
 # Time complexity analysis:
@@ -86,7 +205,8 @@ print(f"Total weight of the Minimum Spanning Tree: {total_weight}")
 
 # 2. Union-Find operations:
 #    - Time complexity: O(E log V), where E is the number of edges and V is the number of vertices.
-#    - Each union and find operation takes almost constant time, amortized over multiple operations (with path compression and union by rank).
+#    - Each union and find operation takes almost constant time, amortized over multiple operations (with path halving and union by size
+#      in the shared DisjointSet).
 
 # Overall time complexity:
 # - Best-case time complexity: O(E log E), since sorting dominates and union-find is near constant.
@@ -95,3 +215,13 @@ print(f"Total weight of the Minimum Spanning Tree: {total_weight}")
 
 # Space complexity:
 # - Space complexity: O(V + E), where V is the number of vertices (for union-find data structures) and E is the number of edges (for storing edges).
+
+# Optimized version (kruskal_optimized):
+# - Sorting: O(E log E), performed by np.argsort on the weight array.
+# - Union-Find: O(E α(V)) worst case with path halving and union by size; the scan stops after n - 1 tree edges.
+# - Space complexity: O(V + E) for the edge arrays, plus O(V) for the DisjointSet parent and size arrays.
+
+# Filter-Kruskal (filter_kruskal):
+# - Expected time complexity: O(E + V log V log (E / V)) for random weights; heavy edges whose endpoints are
+#   already connected are removed by a vectorized filter before they are ever sorted.
+# - Space complexity: O(V + E).
@@ -1,4 +1,7 @@
 import heapq  # Import heapq for using a min-heap
+import time  # Used to time the benchmark runs
+
+import numpy as np  # Vectorized dense-matrix mode and benchmark graphs
 
 def prims_algorithm(n, graph):
     """
@@ -50,24 +53,223 @@ def prims_algorithm(n, graph):
     # Return the total weight of the MST and the edges that form the MST
     return total_weight, mst_edges
 
-# Example usage
-n = 5  # Number of vertices in the graph
-graph = {
-    0: [(1, 2), (3, 6)],        # Vertex 0 is connected to 1 with weight 2, and to 3 with weight 6
-    1: [(0, 2), (2, 3), (3, 8), (4, 5)],  # Vertex 1 has edges to 0, 2, 3, and 4
-    2: [(1, 3), (4, 7)],        # Vertex 2 has edges to 1 and 4
-    3: [(0, 6), (1, 8)],        # Vertex 3 has edges to 0 and 1
-    4: [(1, 5), (2, 7)]         # Vertex 4 has edges to 1 and 2
-}
-
-# Run Prim's algorithm to find the Minimum Spanning Tree (MST)
-total_weight, mst_edges = prims_algorithm(n, graph)
-
-# Output the edges in the MST and the total weight
-print("Edges in the Minimum Spanning Tree:")
-for u, v, weight in mst_edges:
-    print(f"{u} -- {v} == {weight}")
-print(f"Total weight of the Minimum Spanning Tree: {total_weight}")
+
+class IndexedMinHeap:
+    def __init__(self, n):
+        """
+        Binary min-heap over the vertices 0 .. n - 1 with one entry per vertex and decrease-key.
+
+        :param n: Number of vertices
+        """
+        self.heap = []  # Vertices ordered by key
+        self.position = [-1] * n  # Index of every vertex in self.heap, -1 if it is not in the heap
+        self.key = [float('inf')] * n
+
+    def __len__(self):
+        return len(self.heap)
+
+    def _sift_up(self, index):
+        heap, position, key = self.heap, self.position, self.key
+        vertex = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if key[heap[parent]] <= key[vertex]:
+                break
+            heap[index] = heap[parent]  # Move the parent down instead of swapping
+            position[heap[index]] = index
+            index = parent
+        heap[index] = vertex
+        position[vertex] = index
+
+    def _sift_down(self, index):
+        heap, position, key = self.heap, self.position, self.key
+        vertex = heap[index]
+        size = len(heap)
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and key[heap[child + 1]] < key[heap[child]]:
+                child += 1
+            if key[vertex] <= key[heap[child]]:
+                break
+            heap[index] = heap[child]
+            position[heap[index]] = index
+            index = child
+        heap[index] = vertex
+        position[vertex] = index
+
+    def push_or_decrease(self, vertex, key):
+        # Insert vertex, or lower its key if it is already in the heap; returns True if the key changed
+        # Time complexity: O(log V)
+        if key >= self.key[vertex]:
+            return False
+        self.key[vertex] = key
+        if self.position[vertex] == -1:
+            self.heap.append(vertex)
+            self._sift_up(len(self.heap) - 1)
+        else:
+            self._sift_up(self.position[vertex])
+        return True
+
+    def pop(self):
+        # Remove and return the vertex with the smallest key
+        # Time complexity: O(log V)
+        heap = self.heap
+        vertex = heap[0]
+        last = heap.pop()
+        self.position[vertex] = -1
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        return vertex
+
+
+def prims_indexed(n, graph):
+    """
+    Prim's algorithm with an indexed heap, returning a minimum spanning forest.
+
+    The heap holds at most one entry per vertex (its cheapest known connecting edge) and lowers it with
+    decrease-key, instead of pushing every candidate edge. When the heap runs empty while vertices are
+    left, a new tree is started from the next unvisited vertex, so disconnected graphs give a forest.
+
+    :param n: Number of vertices in the graph.
+    :param graph: Adjacency list where graph[u] contains (v, weight) tuples; a dict or a list of lists.
+                  Vertices without an entry in a dict are treated as isolated.
+    :return: Total weight of the minimum spanning forest and list of its edges.
+    """
+    heap = IndexedMinHeap(n)
+    visited = [False] * n
+    parent = [-1] * n  # Tree vertex at the other end of each vertex's cheapest connecting edge
+    key = heap.key
+    get_edges = graph.get if isinstance(graph, dict) else graph.__getitem__
+    total_weight = 0
+    mst_edges = []
+
+    # Time complexity: O(E log V) with at most V heap entries at any time
+    for root in range(n):
+        if visited[root]:
+            continue
+        heap.push_or_decrease(root, 0)  # Start a new tree of the forest
+        while heap:
+            u = heap.pop()
+            visited[u] = True
+            if parent[u] != -1:
+                mst_edges.append((parent[u], u, key[u]))
+                total_weight += key[u]
+            for neighbor, weight in get_edges(u) or ():
+                if not visited[neighbor] and heap.push_or_decrease(neighbor, weight):
+                    parent[neighbor] = u
+
+    return total_weight, mst_edges
+
+
+def prims_dense(matrix):
+    """
+    Prim's algorithm for dense graphs given as an adjacency matrix, returning a minimum spanning forest.
+
+    Instead of a heap, the cheapest connecting edge of every vertex is kept in an array: each step picks
+    the minimum with argmin and relaxes a whole matrix row with NumPy. The O(V^2) total beats the
+    O(E log V) of heap-based versions once E approaches V^2.
+
+    :param matrix: V x V array-like of edge weights; np.inf marks a missing edge (the diagonal is ignored).
+    :return: Total weight of the minimum spanning forest and list of its edges.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    n = len(matrix)
+    key = np.full(n, np.inf)
+    parent = np.full(n, -1)
+    in_tree = np.zeros(n, dtype=bool)
+    total_weight = 0
+    mst_edges = []
+
+    # Time complexity: O(V^2), as V vectorized row relaxations
+    for _ in range(n):
+        candidates = np.where(in_tree, np.inf, key)
+        u = int(np.argmin(candidates))
+        if candidates[u] == np.inf:
+            u = int(np.argmin(in_tree))  # Nothing reachable: start a new tree at the first unvisited vertex
+            parent[u] = -1
+        else:
+            mst_edges.append((int(parent[u]), u, matrix[parent[u], u].item()))
+            total_weight += mst_edges[-1][2]
+        in_tree[u] = True
+        better = (matrix[u] < key) & ~in_tree
+        key[better] = matrix[u][better]
+        parent[better] = u
+
+    return total_weight, mst_edges
+
+
+def benchmark_prims(sparse_n=20_000, edges_per_vertex=10, dense_n=1_000, seed=0):
+    # Compare the edge heap, the indexed heap and the dense array mode
+    rng = np.random.default_rng(seed)
+
+    sources = rng.integers(0, sparse_n, sparse_n * edges_per_vertex).tolist()
+    targets = rng.integers(0, sparse_n, sparse_n * edges_per_vertex).tolist()
+    weights = rng.integers(1, 1_000, sparse_n * edges_per_vertex).tolist()
+    graph = [[] for _ in range(sparse_n)]
+    for u, v, weight in zip(sources, targets, weights):
+        graph[u].append((v, weight))
+        graph[v].append((u, weight))
+    print(f"\nSparse graph, {sparse_n} vertices and {len(weights)} edges:")
+    start = time.perf_counter()
+    prims_algorithm(sparse_n, graph)  # Stops at the component of vertex 0
+    print(f"prims_algorithm : {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    prims_indexed(sparse_n, graph)
+    print(f"prims_indexed   : {time.perf_counter() - start:.3f}s")
+
+    matrix = rng.integers(1, 1_000, (dense_n, dense_n)).astype(float)
+    matrix = np.minimum(matrix, matrix.T)  # Undirected
+    graph = [list(zip(range(dense_n), row)) for row in matrix.tolist()]
+    print(f"\nComplete graph, {dense_n} vertices:")
+    start = time.perf_counter()
+    expected, _ = prims_algorithm(dense_n, graph)
+    print(f"prims_algorithm : {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    total, _ = prims_indexed(dense_n, graph)
+    print(f"prims_indexed   : {time.perf_counter() - start:.3f}s (same total weight: {total == expected})")
+    start = time.perf_counter()
+    total, _ = prims_dense(matrix)
+    print(f"prims_dense     : {time.perf_counter() - start:.3f}s (same total weight: {total == expected})")
+
+
+# The example is guarded so this file can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    n = 5  # Number of vertices in the graph
+    graph = {
+        0: [(1, 2), (3, 6)],        # Vertex 0 is connected to 1 with weight 2, and to 3 with weight 6
+        1: [(0, 2), (2, 3), (3, 8), (4, 5)],  # Vertex 1 has edges to 0, 2, 3, and 4
+        2: [(1, 3), (4, 7)],        # Vertex 2 has edges to 1 and 4
+        3: [(0, 6), (1, 8)],        # Vertex 3 has edges to 0 and 1
+        4: [(1, 5), (2, 7)]         # Vertex 4 has edges to 1 and 2
+    }
+
+    # Run Prim's algorithm to find the Minimum Spanning Tree (MST)
+    total_weight, mst_edges = prims_algorithm(n, graph)
+
+    # Output the edges in the MST and the total weight
+    print("Edges in the Minimum Spanning Tree:")
+    for u, v, weight in mst_edges:
+        print(f"{u} -- {v} == {weight}")
+    print(f"Total weight of the Minimum Spanning Tree: {total_weight}")
+
+    # The indexed version also accepts disconnected graphs and returns a spanning forest
+    graph[5] = [(6, 1)]
+    graph[6] = [(5, 1)]
+    total_weight, mst_edges = prims_indexed(7, graph)
+    print(f"Minimum spanning forest: {mst_edges}, total weight {total_weight}")
+
+    # The dense mode takes an adjacency matrix with np.inf for missing edges
+    matrix = np.full((n, n), np.inf)
+    for u in range(n):
+        for v, weight in graph[u]:
+            matrix[u, v] = weight
+    print(f"Dense mode total weight: {prims_dense(matrix)[0]}")
+
+    benchmark_prims()
 
 # -------------------------------
 # Time complexity analysis:
@@ -87,3 +289,11 @@ print(f"Total weight of the Minimum Spanning Tree: {total_weight}")
 
 # Space complexity:
 # - Space complexity: O(E + V), where E is the number of edges (for storing the graph and heap) and V is the number of vertices (for the visited array).
+
+# Indexed heap (prims_indexed):
+# - Time complexity: O(E log V); the heap never holds more than V entries because keys are lowered in place.
+# - Space complexity: O(V) besides the graph, and disconnected graphs yield a minimum spanning forest.
+
+# Dense array mode (prims_dense):
+# - Time complexity: O(V^2) with vectorized row updates, which beats O(E log V) on dense graphs (E close to V^2).
+# - Space complexity: O(V^2) for the adjacency matrix.
@@ -1,4 +1,7 @@
 from collections import deque, defaultdict  # Importing deque for BFS queue and defaultdict to easily create adjacency lists.
+import time  # Used to time the BFS variants in the benchmark.
+
+import numpy as np  # Used for the CSR arrays and the vectorized direction-optimizing BFS.
 
 def bfs_spanning_tree(n, graph):
     visited = [False] * n  # O(n) - Initialize a list to track visited nodes.
@@ -23,19 +26,21 @@ def bfs_spanning_tree(n, graph):
 
     return spanning_tree_edges  # O(1) - Return the list of edges in the spanning tree.
 
-# Example usage
-n = 5  # Number of vertices.
-graph = defaultdict(list)  # Create a graph with adjacency list representation.
-graph[0] = [1, 3]  # Adding edges to the graph.
-graph[1] = [0, 2, 4]
-graph[2] = [1]
-graph[3] = [0, 4]
-graph[4] = [1, 3]
+# The example is guarded so this file can be imported without running it
+if __name__ == "__main__":
+    # Example usage
+    n = 5  # Number of vertices.
+    graph = defaultdict(list)  # Create a graph with adjacency list representation.
+    graph[0] = [1, 3]  # Adding edges to the graph.
+    graph[1] = [0, 2, 4]
+    graph[2] = [1]
+    graph[3] = [0, 4]
+    graph[4] = [1, 3]
 
-spanning_tree = bfs_spanning_tree(n, graph)  # Find the spanning tree using BFS.
-print("Edges in the Spanning Tree:")
-for u, v in spanning_tree:  # O(E) - Iterate over the edges of the spanning tree.
-    print(f"{u} -- {v}")  # O(1) - Print each edge.
+    spanning_tree = bfs_spanning_tree(n, graph)  # Find the spanning tree using BFS.
+    print("Edges in the Spanning Tree:")
+    for u, v in spanning_tree:  # O(E) - Iterate over the edges of the spanning tree.
+        print(f"{u} -- {v}")  # O(1) - Print each edge.
 
 
 
@@ -77,19 +82,20 @@ def dfs_spanning_tree(n, graph):
 
     return spanning_tree_edges  # O(1) - Return the list of edges in the spanning tree.
 
-# Example usage
-n = 5  # Number of vertices.
-graph = defaultdict(list)  # Create a graph with adjacency list representation.
-graph[0] = [1, 3]  # Adding edges to the graph.
-graph[1] = [0, 2, 4]
-graph[2] = [1]
-graph[3] = [0, 4]
-graph[4] = [1, 3]
+if __name__ == "__main__":
+    # Example usage
+    n = 5  # Number of vertices.
+    graph = defaultdict(list)  # Create a graph with adjacency list representation.
+    graph[0] = [1, 3]  # Adding edges to the graph.
+    graph[1] = [0, 2, 4]
+    graph[2] = [1]
+    graph[3] = [0, 4]
+    graph[4] = [1, 3]
 
-spanning_tree = dfs_spanning_tree(n, graph)  # Find the spanning tree using DFS.
-print("Edges in the Spanning Tree:")
-for u, v in spanning_tree:  # O(E) - Iterate over the edges of the spanning tree.
-    print(f"{u} -- {v}")  # O(1) - Print each edge.
+    spanning_tree = dfs_spanning_tree(n, graph)  # Find the spanning tree using DFS.
+    print("Edges in the Spanning Tree:")
+    for u, v in spanning_tree:  # O(E) - Iterate over the edges of the spanning tree.
+        print(f"{u} -- {v}")  # O(1) - Print each edge.
 
 """
 Time Complexity for DFS-based Spanning Tree
@@ -108,3 +114,216 @@ Space Complexity:
 O(V+E)
 This is due to the space required for the visited, parent arrays (O(V)) and the adjacency list (O(E))."""
 
+
+def edges_to_csr(n, sources, targets):
+    # Build a CSR (compressed sparse row) adjacency from parallel arrays of edge endpoints.
+    # indices[indptr[u]:indptr[u + 1]] holds the neighbours of u.
+    sources = np.asarray(sources, dtype=np.int64)  # O(E) - Convert the edge sources to an array.
+    targets = np.asarray(targets, dtype=np.int64)  # O(E) - Convert the edge targets to an array.
+    order = np.argsort(sources, kind="stable")  # O(E log E) - Group the edges by their source vertex.
+    indices = targets[order]  # O(E) - Neighbours laid out vertex after vertex.
+    indptr = np.zeros(n + 1, dtype=np.int64)  # O(n) - Row pointer array.
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])  # O(n + E) - Prefix sums of the out-degrees.
+    return indptr, indices
+
+
+def adjacency_to_csr(n, graph):
+    # Convert an adjacency list (dict or list of neighbour lists) into CSR arrays.
+    degrees = [len(graph[u]) for u in range(n)]  # O(n) - Out-degree of every vertex.
+    sources = np.repeat(np.arange(n, dtype=np.int64), degrees)  # O(E) - Source of every edge.
+    targets = np.fromiter((v for u in range(n) for v in graph[u]), dtype=np.int64, count=int(sum(degrees)))  # O(E)
+    return edges_to_csr(n, sources, targets)
+
+
+def _gather_neighbours(indptr, indices, vertices):
+    # Return (owner, neighbour) pairs for every edge leaving the given vertices, without a Python loop.
+    starts = indptr[vertices]  # O(k) - First edge of each vertex.
+    counts = indptr[vertices + 1] - starts  # O(k) - Number of edges of each vertex.
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    owners = np.repeat(vertices, counts)  # O(total) - Vertex owning each gathered edge.
+    # Edge p of the output belongs to segment s and maps to starts[s] + (p - first output slot of s).
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return owners, indices[shift + np.arange(total)]
+
+
+def _bottom_up_step(in_indptr, in_indices, unvisited, frontier_bits, probe_rounds):
+    # Every unvisited vertex looks for a parent in the frontier among its in-neighbours.
+    # The first probe_rounds neighbours are checked one slot at a time for all vertices at once, so a
+    # vertex stops scanning as soon as it finds a parent; whatever is left is resolved in a single gather.
+    position = in_indptr[unvisited]  # O(k) - Next in-edge to inspect for each candidate.
+    end = in_indptr[unvisited + 1]  # O(k) - One past the last in-edge of each candidate.
+    keep = position < end  # Vertices without in-edges can never be reached bottom-up.
+    candidates, position, end = unvisited[keep], position[keep], end[keep]
+    found_vertices, found_parents = [], []
+
+    for _ in range(probe_rounds):
+        if candidates.size == 0:
+            break
+        neighbours = in_indices[position]  # O(k) - One in-neighbour per candidate.
+        hit = ((frontier_bits[neighbours >> 3] >> (neighbours & 7)) & 1).astype(bool)  # Bitset membership test.
+        found_vertices.append(candidates[hit])
+        found_parents.append(neighbours[hit])
+        position += 1
+        keep = ~hit & (position < end)  # Drop vertices that found a parent or ran out of in-edges.
+        candidates, position, end = candidates[keep], position[keep], end[keep]
+
+    if candidates.size:
+        # Scan the remaining in-edges of the stubborn candidates in one vectorized pass.
+        counts = end - position
+        owners = np.repeat(candidates, counts)
+        shift = np.repeat(position - (np.cumsum(counts) - counts), counts)
+        neighbours = in_indices[shift + np.arange(int(counts.sum()))]
+        hit = ((frontier_bits[neighbours >> 3] >> (neighbours & 7)) & 1).astype(bool)
+        vertices, first = np.unique(owners[hit], return_index=True)  # First frontier in-neighbour per vertex.
+        found_vertices.append(vertices)
+        found_parents.append(neighbours[hit][first])
+
+    if not found_vertices:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    return np.concatenate(found_vertices), np.concatenate(found_parents)
+
+
+def direction_optimizing_bfs(indptr, indices, source=0, in_indptr=None, in_indices=None,
+                             direction="auto", alpha=14, beta=24, probe_rounds=8):
+    """
+    Level-synchronous BFS that switches between top-down and bottom-up steps (Beamer et al.).
+
+    Top-down steps expand the frontier along out-edges; bottom-up steps let every unvisited vertex
+    search its in-edges for a frontier vertex, which is far cheaper once the frontier covers a large
+    part of a low-diameter graph. Each level is processed with NumPy array operations and the
+    frontier is stored as a packed bitset for the bottom-up membership tests.
+
+    :param indptr: CSR row pointer array of the out-adjacency (see edges_to_csr / adjacency_to_csr)
+    :param indices: CSR neighbour array of the out-adjacency
+    :param source: The starting vertex
+    :param in_indptr: CSR row pointer array of the in-adjacency; omit for undirected (symmetric) graphs
+    :param in_indices: CSR neighbour array of the in-adjacency; omit for undirected (symmetric) graphs
+    :param direction: "auto" to switch heuristically, or "top-down" / "bottom-up" to force one mode
+    :param alpha: Switch to bottom-up once the frontier's edges exceed (unexplored edges / alpha)
+    :param beta: Switch back to top-down once the frontier holds fewer than (n / beta) vertices
+    :param probe_rounds: In-edges probed slot by slot per bottom-up step before a bulk scan
+    :return: Tuple (distances, parents) of int64 arrays; unreachable vertices and the source have parent -1,
+             unreachable vertices have distance -1
+    """
+    if direction not in ("auto", "top-down", "bottom-up"):
+        raise ValueError("direction must be 'auto', 'top-down' or 'bottom-up'")
+    if in_indptr is None:
+        in_indptr, in_indices = indptr, indices  # Undirected graph: in-edges equal out-edges.
+
+    n = len(indptr) - 1
+    out_degree = np.diff(indptr)  # O(n) - Out-degree of every vertex.
+    in_degree = np.diff(in_indptr)  # O(n) - In-degree of every vertex.
+
+    distances = np.full(n, -1, dtype=np.int64)  # O(n) - -1 marks an unreached vertex.
+    parents = np.full(n, -1, dtype=np.int64)  # O(n) - -1 marks the root or an unreached vertex.
+    visited = np.zeros(n, dtype=bool)  # O(n) - Visited flags.
+    distances[source] = 0
+    visited[source] = True
+
+    frontier = np.array([source], dtype=np.int64)
+    edges_to_check = int(in_degree.sum()) - int(in_degree[source])  # In-edges of still unvisited vertices.
+    bottom_up = direction == "bottom-up"
+    level = 0
+
+    # Each iteration settles one BFS level; total work is O(V + E) edge inspections.
+    while frontier.size:
+        frontier_edges = int(out_degree[frontier].sum())
+        if direction == "auto":
+            if not bottom_up and frontier_edges > edges_to_check / alpha:
+                bottom_up = True  # The frontier is heavy: let the unvisited side do the searching.
+            elif bottom_up and frontier.size < n / beta:
+                bottom_up = False  # The frontier is small again: go back to expanding it directly.
+
+        if bottom_up:
+            frontier_mask = np.zeros(n, dtype=bool)
+            frontier_mask[frontier] = True
+            frontier_bits = np.packbits(frontier_mask, bitorder="little")  # One bit per vertex.
+            unvisited = np.flatnonzero(~visited)
+            next_frontier, next_parents = _bottom_up_step(in_indptr, in_indices, unvisited,
+                                                          frontier_bits, probe_rounds)
+        else:
+            owners, neighbours = _gather_neighbours(indptr, indices, frontier)
+            fresh = ~visited[neighbours]  # Keep only edges leading to unvisited vertices.
+            owners, neighbours = owners[fresh], neighbours[fresh]
+            next_frontier, first = np.unique(neighbours, return_index=True)  # One parent per new vertex.
+            next_parents = owners[first]
+
+        level += 1
+        visited[next_frontier] = True
+        distances[next_frontier] = level
+        parents[next_frontier] = next_parents
+        edges_to_check -= int(in_degree[next_frontier].sum())
+        frontier = next_frontier
+
+    return distances, parents
+
+
+def generate_power_law_graph(n, average_degree=8, exponent=2.5, seed=0):
+    # Chung-Lu style random undirected graph whose degree sequence follows a power law.
+    rng = np.random.default_rng(seed)
+    weights = (np.arange(1, n + 1) ** (-1.0 / (exponent - 1)))  # Expected-degree weights.
+    probabilities = weights / weights.sum()
+    m = n * average_degree // 2  # Number of undirected edges to sample.
+    u = rng.choice(n, size=m, p=probabilities)
+    v = rng.choice(n, size=m, p=probabilities)
+    keep = u != v  # Drop self loops.
+    u, v = u[keep], v[keep]
+    # Store both directions so the CSR is symmetric.
+    return edges_to_csr(n, np.concatenate([u, v]), np.concatenate([v, u]))
+
+
+def benchmark_bfs(sizes=(10_000, 100_000), average_degree=16, repeats=3):
+    # Compare the list-based BFS above with the vectorized direction-optimizing BFS.
+    print("\nBFS benchmark on power-law graphs (best of", repeats, "runs):")
+    print(f"{'vertices':>10} {'edges':>10} {'bfs_spanning_tree':>18} {'top-down':>10} {'auto':>10}")
+    for n in sizes:
+        indptr, indices = generate_power_law_graph(n, average_degree)
+        adjacency = [indices[indptr[u]:indptr[u + 1]].tolist() for u in range(n)]
+        timings = []
+        for run in (lambda: bfs_spanning_tree(n, adjacency),
+                    lambda: direction_optimizing_bfs(indptr, indices, direction="top-down"),
+                    lambda: direction_optimizing_bfs(indptr, indices, direction="auto")):
+            best = float("inf")
+            for _ in range(repeats):
+                start = time.perf_counter()
+                run()
+                best = min(best, time.perf_counter() - start)
+            timings.append(best)
+        print(f"{n:>10} {len(indices):>10} {timings[0]:>17.4f}s {timings[1]:>9.4f}s {timings[2]:>9.4f}s")
+
+
+if __name__ == "__main__":
+    # Example usage
+    n = 5  # Number of vertices.
+    graph = defaultdict(list)  # Same graph as above.
+    graph[0] = [1, 3]
+    graph[1] = [0, 2, 4]
+    graph[2] = [1]
+    graph[3] = [0, 4]
+    graph[4] = [1, 3]
+
+    indptr, indices = adjacency_to_csr(n, graph)  # Convert the adjacency list to CSR arrays once.
+    distances, parents = direction_optimizing_bfs(indptr, indices, source=0)
+    print("Direction-optimizing BFS distances:", distances.tolist())
+    print("Direction-optimizing BFS parents:", parents.tolist())
+
+    benchmark_bfs()
+
+"""
+Time Complexity for Direction-Optimizing BFS
+Best Case, Average Case, Worst Case:
+
+O(V+E)
+Explanation: Each level is handled by a constant number of NumPy passes. A top-down step touches the
+out-edges of the frontier, a bottom-up step touches the in-edges of unvisited vertices only until a
+parent is found, so on low-diameter graphs the large middle levels inspect far fewer than E edges.
+Building the CSR arrays costs O(E log E) once because the edges are sorted by source.
+Space Complexity:
+
+O(V+E)
+This is due to the CSR arrays (O(V + E)), the distance/parent/visited arrays (O(V)) and the frontier bitset (O(V / 8)).
+"""
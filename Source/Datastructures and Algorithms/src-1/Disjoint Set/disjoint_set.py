@@ -0,0 +1,249 @@
+import time
+
+import numpy as np
+
+# Class for an array-backed Disjoint Set (Union-Find) with batch operations
+class DisjointSet:
+    def __init__(self, n):
+        # Time Complexity: O(n)
+        # Every element starts as the root of its own set
+        self.n = n
+        self.parent = np.arange(n, dtype=np.int64)  # parent[i] == i marks a root
+        self.size = np.ones(n, dtype=np.int64)  # Only meaningful for roots
+        # Views of the same buffers: indexing them gives plain Python ints, which keeps the scalar
+        # find and union fast enough for per-edge loops such as Kruskal's algorithm
+        self._parent = memoryview(self.parent)
+        self._size = memoryview(self.size)
+
+    # Find the root of the set containing u
+    def find(self, u):
+        # Time Complexity: O(α(n)) amortized, with iterative path halving (no recursion limit)
+        parent = self._parent
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]  # Point u at its grandparent while walking up
+            u = parent[u]
+        return u
+
+    # Merge the sets containing u and v
+    def union(self, u, v):
+        # Time Complexity: O(α(n)) amortized, with union by size
+        root_u = self.find(u)
+        root_v = self.find(v)
+        if root_u == root_v:
+            return False  # Already in the same set
+        size = self._size
+        if size[root_u] < size[root_v]:
+            root_u, root_v = root_v, root_u
+        self._parent[root_v] = root_u  # Attach the smaller tree under the larger one
+        size[root_u] += size[root_v]
+        return True
+
+    # Check whether u and v are in the same set
+    def connected(self, u, v):
+        # Time Complexity: O(α(n)) amortized
+        return self.find(u) == self.find(v)
+
+    # Find the roots of many elements at once
+    def find_many(self, ids):
+        # Time Complexity: O(k * d), where k is the number of ids and d the tree depth, in vectorized steps
+        ids = np.asarray(ids, dtype=np.int64)
+        roots = self.parent[ids]
+        while True:
+            grandparents = self.parent[roots]
+            if np.array_equal(grandparents, roots):
+                break
+            roots = grandparents  # Every element climbs one level per step
+        self.parent[ids] = roots  # Full path compression for the queried elements
+        return roots
+
+    # Merge the sets of many (u, v) pairs at once
+    def union_many(self, pairs):
+        # Time Complexity: O(r * m log m) for m pairs, where r is the number of hooking rounds (small in practice);
+        # independent of n, so many small batches stay cheap on a huge structure
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        left, right = pairs[:, 0], pairs[:, 1]
+        merges = 0
+
+        while left.size:
+            root_left = self.find_many(left)
+            root_right = self.find_many(right)
+            pending = root_left != root_right  # Pairs whose sets are still separate
+            if not pending.any():
+                break
+            left, right = left[pending], right[pending]
+            root_left, root_right = root_left[pending], root_right[pending]
+            # Hook every root onto the smallest root it must be joined with. Roots only ever point to
+            # smaller indices, so no cycles can form; conflicting pairs are resolved in the next round.
+            np.minimum.at(self.parent, np.maximum(root_left, root_right), np.minimum(root_left, root_right))
+            # Every hooked root joined one other set, and the hooks form a forest, so each is one merge
+            hooked = np.unique(np.maximum(root_left, root_right))
+            merges += len(hooked)
+            # Hooking ignores sizes: add each hooked root's size to the root it now hangs under
+            np.add.at(self.size, self.find_many(hooked), self.size[hooked])
+
+        return merges  # Number of merges performed
+
+    # Count the number of disjoint sets
+    def component_count(self):
+        # Time Complexity: O(n)
+        return int(np.count_nonzero(self.parent == np.arange(self.n)))
+
+    # Label every element with the index (0 .. k - 1) of its set
+    def component_labels(self):
+        # Time Complexity: O(n log n) because of the sort inside np.unique
+        roots = self.find_many(np.arange(self.n))
+        _, labels = np.unique(roots, return_inverse=True)
+        return labels
+
+
+# Class for a Disjoint Set whose unions can be undone, used for offline dynamic connectivity
+class RollbackDisjointSet:
+    def __init__(self, n):
+        # Time Complexity: O(n)
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.components = n
+        self.history = []  # Stack of attached roots, one entry per successful union
+
+    # Find the root of the set containing u
+    def find(self, u):
+        # Time Complexity: O(log n); no path compression, so every union can be undone exactly
+        while self.parent[u] != u:
+            u = self.parent[u]
+        return u
+
+    # Merge the sets containing u and v
+    def union(self, u, v):
+        # Time Complexity: O(log n), with union by size keeping the trees shallow
+        root_u = self.find(u)
+        root_v = self.find(v)
+        if root_u == root_v:
+            return False
+        if self.size[root_u] < self.size[root_v]:
+            root_u, root_v = root_v, root_u
+        self.parent[root_v] = root_u
+        self.size[root_u] += self.size[root_v]
+        self.components -= 1
+        self.history.append(root_v)
+        return True
+
+    # Remember the current state
+    def snapshot(self):
+        # Time Complexity: O(1)
+        return len(self.history)
+
+    # Undo every union performed after the given snapshot
+    def rollback(self, snapshot):
+        # Time Complexity: O(k), where k is the number of unions undone
+        while len(self.history) > snapshot:
+            root_v = self.history.pop()
+            root_u = self.parent[root_v]
+            self.size[root_u] -= self.size[root_v]
+            self.parent[root_v] = root_v
+            self.components += 1
+
+
+def offline_dynamic_connectivity(n, queries):
+    """
+    Answer connectivity queries on a graph whose edges are added and removed over time.
+
+    Every edge is alive during an interval of query indices. The intervals are stored in a segment
+    tree over time, which is walked depth-first: entering a node applies its edges to a
+    RollbackDisjointSet and leaving the node rolls them back.
+
+    :param n: Number of vertices
+    :param queries: List of ("add", u, v), ("remove", u, v), ("connected", u, v) or ("count",) tuples
+    :return: List with one answer per "connected" (bool) or "count" (number of components) query
+    Time Complexity: O(q log q log n) for q queries
+    """
+    q = len(queries)
+    tree = [[] for _ in range(4 * max(q, 1))]  # Edges alive over each segment tree node's time range
+    open_edges = {}  # Edge -> stack of times it was added
+
+    def insert(node, low, high, start, end, edge):
+        # Add edge to every node whose time range lies inside [start, end)
+        if end <= low or high <= start:
+            return
+        if start <= low and high <= end:
+            tree[node].append(edge)
+            return
+        middle = (low + high) // 2
+        insert(2 * node, low, middle, start, end, edge)
+        insert(2 * node + 1, middle, high, start, end, edge)
+
+    for time_index, (operation, *vertices) in enumerate(queries):
+        if operation in ("add", "remove"):
+            edge = (min(vertices), max(vertices))
+            if operation == "add":
+                open_edges.setdefault(edge, []).append(time_index)
+            else:
+                insert(1, 0, q, open_edges[edge].pop(), time_index, edge)
+    for edge, starts in open_edges.items():
+        for start in starts:
+            insert(1, 0, q, start, q, edge)  # Still present at the end
+
+    dsu = RollbackDisjointSet(n)
+    answers = []
+
+    def walk(node, low, high):
+        snapshot = dsu.snapshot()
+        for u, v in tree[node]:
+            dsu.union(u, v)
+        if high - low == 1:
+            operation, *vertices = queries[low]
+            if operation == "connected":
+                answers.append(dsu.find(vertices[0]) == dsu.find(vertices[1]))
+            elif operation == "count":
+                answers.append(dsu.components)
+        else:
+            middle = (low + high) // 2
+            walk(2 * node, low, middle)
+            walk(2 * node + 1, middle, high)
+        dsu.rollback(snapshot)  # Leave the structure as it was before this node
+
+    if q:
+        walk(1, 0, q)
+    return answers
+
+
+# Example Usage
+if __name__ == "__main__":
+    # Single operations
+    ds = DisjointSet(6)
+    ds.union(0, 1)
+    ds.union(1, 2)
+    ds.union(3, 4)
+    print("0 and 2 connected:", ds.connected(0, 2))
+    print("0 and 3 connected:", ds.connected(0, 3))
+    print("Number of components:", ds.component_count())
+    print("Component labels:", ds.component_labels().tolist())
+
+    # Batch operations
+    ds = DisjointSet(6)
+    merges = ds.union_many([(0, 1), (1, 2), (3, 4)])
+    print("\nMerges performed by union_many:", merges)
+    print("Roots of [0, 2, 4, 5]:", ds.find_many([0, 2, 4, 5]).tolist())
+
+    # Offline dynamic connectivity with edge removals
+    queries = [
+        ("add", 0, 1),
+        ("add", 1, 2),
+        ("connected", 0, 2),
+        ("remove", 0, 1),
+        ("connected", 0, 2),
+        ("count",),
+    ]
+    print("\nDynamic connectivity answers:", offline_dynamic_connectivity(4, queries))
+
+    # Batch versus one-at-a-time unions on random pairs
+    n, m = 1_000_000, 1_000_000
+    rng = np.random.default_rng(0)
+    pairs = rng.integers(0, n, (m, 2))
+    start = time.perf_counter()
+    DisjointSet(n).union_many(pairs)
+    print(f"\nunion_many on {m} pairs: {time.perf_counter() - start:.3f}s")
+    ds = DisjointSet(n)
+    start = time.perf_counter()
+    for u, v in pairs[:100_000].tolist():
+        ds.union(u, v)
+    print(f"union on 100000 pairs: {time.perf_counter() - start:.3f}s")
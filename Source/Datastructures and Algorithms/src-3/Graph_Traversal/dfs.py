@@ -1,9 +1,12 @@
 from collections import deque
+import random
+import time
 
 class Graph:
 
     def __init__(self):
         self.graph = {}
+        self._condensation = None  # Cached (component_of, dag) for reachability queries
 
     def add_edge(self, u, v):
         if u not in self.graph:
@@ -12,6 +15,7 @@ class Graph:
             self.graph[v] = []
 
         self.graph[u].append(v)
+        self._condensation = None  # The graph changed, so cached components are stale
 
     def print_graph(self):
         for u in self.graph:
@@ -33,6 +37,159 @@ class Graph:
                     stack.append(neighbour)  # Push unvisited neighbors onto the stack
         return dfs
 
+    def tarjan_scc(self):  # Iterative Tarjan: components come out in reverse topological order
+        index = {}
+        low = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+
+        for root in self.graph:
+            if root in index:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.graph[root]))]  # Explicit call stack: (vertex, remaining neighbours)
+
+            while work:
+                current, neighbours = work[-1]
+                for neighbour in neighbours:
+                    if neighbour not in index:
+                        index[neighbour] = low[neighbour] = counter
+                        counter += 1
+                        stack.append(neighbour)
+                        on_stack.add(neighbour)
+                        work.append((neighbour, iter(self.graph[neighbour])))
+                        break
+                    if neighbour in on_stack and index[neighbour] < low[current]:
+                        low[current] = index[neighbour]
+                else:
+                    work.pop()
+                    if work and low[current] < low[work[-1][0]]:
+                        low[work[-1][0]] = low[current]  # Pass the low-link up to the parent
+                    if low[current] == index[current]:  # current is the root of a component
+                        component = []
+                        while True:
+                            vertex = stack.pop()
+                            on_stack.discard(vertex)
+                            component.append(vertex)
+                            if vertex == current:
+                                break
+                        components.append(component)
+        return components
+
+    def kosaraju_scc(self):  # Iterative Kosaraju: components come out in topological order
+        visited = set()
+        finished = []  # Vertices in order of DFS completion
+
+        for root in self.graph:
+            if root in visited:
+                continue
+            visited.add(root)
+            work = [(root, iter(self.graph[root]))]
+            while work:
+                current, neighbours = work[-1]
+                for neighbour in neighbours:
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        work.append((neighbour, iter(self.graph[neighbour])))
+                        break
+                else:
+                    work.pop()
+                    finished.append(current)
+
+        reverse = {u: [] for u in self.graph}
+        for u in self.graph:
+            for v in self.graph[u]:
+                reverse[v].append(u)
+
+        assigned = set()
+        components = []
+        for root in reversed(finished):  # Latest finisher first: it lies in a source component
+            if root in assigned:
+                continue
+            assigned.add(root)
+            component = []
+            stack = [root]
+            while stack:
+                current = stack.pop()
+                component.append(current)
+                for neighbour in reverse[current]:
+                    if neighbour not in assigned:
+                        assigned.add(neighbour)
+                        stack.append(neighbour)
+            components.append(component)
+        return components
+
+    def condensation(self):  # Collapse every SCC into one vertex; the result is a DAG
+        components = self.tarjan_scc()[::-1]  # Topological order, so component ids are already sorted
+        component_of = {}
+        for i, component in enumerate(components):
+            for vertex in component:
+                component_of[vertex] = i
+
+        dag = [set() for _ in components]  # dag[i] = components reachable from component i by one edge
+        for u in self.graph:
+            for v in self.graph[u]:
+                if component_of[u] != component_of[v]:
+                    dag[component_of[u]].add(component_of[v])
+        return components, component_of, dag
+
+    def condensation_edges(self):  # Edge list of the condensation, ready for kahn_topological_sort
+        components, _, dag = self.condensation()
+        return len(components), [(i, j) for i in range(len(dag)) for j in dag[i]]
+
+    def can_reach(self, u, v):  # Reachability query on the condensation DAG
+        if self._condensation is None:
+            _, component_of, dag = self.condensation()
+            self._condensation = (component_of, dag)
+        component_of, dag = self._condensation
+        source, target = component_of[u], component_of[v]
+        if source == target:
+            return True
+        if source > target:
+            return False  # Components are numbered in topological order, so no path can go backwards
+
+        visited = {source}
+        stack = [source]
+        while stack:
+            current = stack.pop()
+            for neighbour in dag[current]:
+                if neighbour == target:
+                    return True
+                if neighbour < target and neighbour not in visited:  # Components after target cannot lead to it
+                    visited.add(neighbour)
+                    stack.append(neighbour)
+        return False
+
+
+def benchmark_scc(n=1_000_000, m=2_000_000, seed=0):
+    rng = random.Random(seed)
+    g = Graph()
+    for u in range(n):
+        g.graph[u] = []
+    for _ in range(m):
+        g.graph[rng.randrange(n)].append(rng.randrange(n))  # Filled directly: add_edge would be slower here
+
+    print(f"\nSCC on {n} vertices and {m} edges:")
+    start = time.perf_counter()
+    tarjan = g.tarjan_scc()
+    print(f"Tarjan       : {time.perf_counter() - start:.2f}s ({len(tarjan)} components)")
+    start = time.perf_counter()
+    kosaraju = g.kosaraju_scc()
+    print(f"Kosaraju     : {time.perf_counter() - start:.2f}s ({len(kosaraju)} components)")
+
+    start = time.perf_counter()
+    g.can_reach(0, 0)  # Builds and caches the condensation
+    print(f"Condensation : {time.perf_counter() - start:.2f}s")
+    queries = [(rng.randrange(n), rng.randrange(n)) for _ in range(1000)]
+    start = time.perf_counter()
+    reachable = sum(g.can_reach(u, v) for u, v in queries)
+    print(f"1000 reachability queries: {time.perf_counter() - start:.2f}s ({reachable} reachable)")
+
 
 if __name__ == "__main__":
 
@@ -50,3 +207,12 @@ if __name__ == "__main__":
     g.print_graph()
 
     print("DFS Traversal:", g.depth_first_search())
+
+    print("Tarjan SCCs:", g.tarjan_scc())
+    print("Kosaraju SCCs:", g.kosaraju_scc())
+    components, component_of, dag = g.condensation()
+    print("Condensation:", components, "->", dag)
+    print("Condensation edges:", g.condensation_edges())
+    print("3 reaches 1:", g.can_reach(3, 1), "| 1 reaches 3:", g.can_reach(1, 3))
+
+    benchmark_scc()
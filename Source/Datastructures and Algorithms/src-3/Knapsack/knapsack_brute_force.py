@@ -1,3 +1,19 @@
+import importlib.util
+import numbers
+import os
+import random
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from knapsack_dynamic_programming import is_knapsack_profitable as knapsack_dp  # Rolling-row DP, returns the best profit
+
+# Branch and bound lives in Source/Algorithms under a file name that is not a valid module name
+BRANCH_AND_BOUND_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "Algorithms",
+                                     "0-1 knapsack using branch and bound.py")
+MAX_DP_CAPACITY = 10_000_000  # Largest capacity whose DP row (8 bytes per entry) we are willing to allocate
+
 
 def knapsack_recursive(weights, profits, capacity, index = 0):
     if index == len(weights) or index == len(profits):
@@ -11,17 +27,138 @@ def knapsack_recursive(weights, profits, capacity, index = 0):
         )
 
 
+def knapsack_memoized(weights, profits, capacity):
+    # Same recursion, but every (index, capacity) state is solved once: at most n * (capacity + 1) states,
+    # and far fewer when only a few distinct remaining capacities occur
+    n = min(len(weights), len(profits))
+
+    @lru_cache(maxsize=None)
+    def best(index, capacity):
+        if index == n:
+            return 0
+        skip = best(index + 1, capacity)
+        if weights[index] > capacity:
+            return skip
+        return max(skip, profits[index] + best(index + 1, capacity - weights[index]))
+
+    return best(0, capacity)
+
+
+def _subset_sums(weights, profits):
+    # Total weight and profit of all 2^k subsets, built by doubling: O(2^k)
+    # (an empty list would make np.asarray float64, so no items keeps plain int64)
+    total_weights = np.zeros(1, dtype=np.result_type(np.asarray(weights), np.int64) if len(weights) else np.int64)
+    total_profits = np.zeros(1, dtype=np.result_type(np.asarray(profits), np.int64) if len(profits) else np.int64)
+    for weight, profit in zip(weights, profits):
+        total_weights = np.concatenate((total_weights, total_weights + weight))
+        total_profits = np.concatenate((total_profits, total_profits + profit))
+    return total_weights, total_profits
+
+
+def knapsack_meet_in_the_middle(weights, profits, capacity):
+    # O(2^(n/2) * n) time and O(2^(n/2)) memory, independent of the capacity: good for n <= 40 with huge capacities
+    if capacity < 0:
+        return 0  # Not even the empty subset fits
+    half = len(weights) // 2
+    first_weights, first_profits = _subset_sums(weights[:half], profits[:half])
+    second_weights, second_profits = _subset_sums(weights[half:], profits[half:])
+
+    # Sort the second half by weight and keep only subsets that beat every lighter one (dominance pruning)
+    order = np.argsort(second_weights, kind="stable")
+    second_weights, second_profits = second_weights[order], np.maximum.accumulate(second_profits[order])
+    keep = np.ones(len(second_profits), dtype=bool)
+    keep[1:] = second_profits[1:] > second_profits[:-1]
+    second_weights, second_profits = second_weights[keep], second_profits[keep]
+
+    # For every first-half subset that fits, binary search the best second half for the remaining capacity
+    fits = first_weights <= capacity
+    first_weights, first_profits = first_weights[fits], first_profits[fits]
+    match = np.searchsorted(second_weights, capacity - first_weights, side="right") - 1  # >= 0: empty subset weighs 0
+    return (first_profits + second_profits[match]).max().item()
+
+
+@lru_cache(maxsize=None)
+def _branch_and_bound_module():
+    # Loaded on first use, so this file still imports when the Knapsack folder is copied elsewhere
+    try:
+        spec = importlib.util.spec_from_file_location("knapsack_branch_and_bound", BRANCH_AND_BOUND_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except FileNotFoundError as error:
+        raise ImportError(f"Branch and bound solver not found at {os.path.normpath(BRANCH_AND_BOUND_PATH)}; "
+                          f"the other knapsack methods do not need it") from error
+    return module
+
+
+def knapsack_branch_and_bound(weights, profits, capacity):
+    branch_and_bound = _branch_and_bound_module()
+    items = [branch_and_bound.KnapsackItem(weight, profit) for weight, profit in zip(weights, profits)]
+    return branch_and_bound.knapsack_branch_and_bound(capacity, items)
+
+
+def choose_knapsack_method(n, capacity, integral=True):
+    # Rough cost model: the DP does n * capacity vectorized cell updates, meet in the middle sorts and searches
+    # about 2^(n/2) subsets (each costing a few dozen cell updates), branch and bound handles the rest.
+    # The DP indexes its row by weight, so it is only an option when the weights and capacity are integers.
+    dp_cost = n * (capacity + 1) if integral and capacity <= MAX_DP_CAPACITY else float("inf")
+    mitm_cost = 2 ** ((n + 1) // 2) * 32 if n <= 40 else float("inf")
+    if dp_cost == mitm_cost == float("inf"):
+        return "branch_and_bound"
+    return "dp" if dp_cost <= mitm_cost else "meet_in_the_middle"
+
+
+def solve_knapsack(weights, profits, capacity):
+    # Pick the cheapest exact method for the instance size; returns (best profit, method used)
+    integral = all(isinstance(weight, numbers.Integral) for weight in (*weights, capacity))
+    method = choose_knapsack_method(len(weights), capacity, integral)
+    if capacity < 0 or not weights:
+        return 0, method  # Nothing fits, or nothing to take
+    if method == "dp":
+        return knapsack_dp(weights, profits, capacity), method
+    if method == "meet_in_the_middle":
+        return knapsack_meet_in_the_middle(weights, profits, capacity), method
+    return knapsack_branch_and_bound(weights, profits, capacity), method
+
+
 def is_knapsack_profitable(weights, profits, capacity):
-    # Call the knapsack function and check if the result is non-zero
-    result = knapsack_recursive(weights, profits, capacity)
-    return result > 0
-
-# Example usage
-weights = [1, 2, 3]
-profits = [6, 10, 12]
-capacity = 5
-
-if is_knapsack_profitable(weights, profits, capacity):
-    print("Profitable")
-else:
-    print("Not profitable")
+    # Some profit is possible exactly when a single item with positive profit fits: O(n), no search needed
+    return any(weight <= capacity and profit > 0 for weight, profit in zip(weights, profits))
+
+
+def benchmark(seed=0):
+    rng = random.Random(seed)
+
+    n = 20
+    for scale in (10, 10**6):  # Small weights repeat remaining capacities, which is where memoization pays off
+        weights = [rng.randint(1, scale) for _ in range(n)]
+        profits = [rng.randint(1, 1000) for _ in range(n)]
+        capacity = sum(weights) // 2
+        print(f"{n} items, capacity {capacity}:")
+        for method in (knapsack_recursive, knapsack_memoized, knapsack_meet_in_the_middle):
+            start = time.perf_counter()
+            best = method(weights, profits, capacity)
+            print(f"  {method.__name__:<28} {time.perf_counter() - start:.3f}s (best profit {best})")
+
+    for n, scale in ((36, 10**12), (200, 100), (60, 10**9)):
+        weights = [rng.randint(1, scale) for _ in range(n)]
+        profits = [rng.randint(1, 1000) for _ in range(n)]
+        capacity = sum(weights) // 2
+        start = time.perf_counter()
+        best, method = solve_knapsack(weights, profits, capacity)
+        print(f"{n} items, capacity {capacity}: {method} in {time.perf_counter() - start:.3f}s (best profit {best})")
+
+
+if __name__ == "__main__":
+    # Example usage
+    weights = [1, 2, 3]
+    profits = [6, 10, 12]
+    capacity = 5
+
+    if is_knapsack_profitable(weights, profits, capacity):
+        print("Profitable")
+    else:
+        print("Not profitable")
+
+    print("Best profit:", solve_knapsack(weights, profits, capacity))
+
+    benchmark()
@@ -1,5 +1,23 @@
+import time
+
+import numpy as np
+
+
 def is_knapsack_profitable(weights, profits, capacity):
-    # table = [x for x in range(columns) for x in range(rows)]
+    # One rolling row instead of a (len(weights) + 1) x (capacity + 1) table: row[j] is the best profit
+    # with total weight at most j using the items seen so far
+    row = np.zeros(capacity + 1, dtype=np.result_type(np.asarray(profits), np.int64))  # Float profits stay float
+
+    for i in range(len(weights)):
+        if weights[i] > capacity:
+            continue
+        # Whole-row update; the right-hand side is built from the previous row before it is written back
+        np.maximum(row[weights[i]:], row[:capacity + 1 - weights[i]] + profits[i], out=row[weights[i]:])
+
+    return row[-1].item()
+
+
+def is_knapsack_profitable_table(weights, profits, capacity):  # Original table version, kept for comparison
     table = [[0 for _ in range(capacity + 1)] for _ in range(len(weights) + 1)]
 
     for i in range(len(weights)):
@@ -11,12 +29,30 @@ def is_knapsack_profitable(weights, profits, capacity):
 
     return table[-1][-1]
 
-# Example usage
-weights = [1, 2, 3]
-profits = [6, 10, 12]
-capacity = 5
 
-if is_knapsack_profitable(weights, profits, capacity):
-    print("Profitable")
-else:
-    print("Not profitable")
+def benchmark(num_items=100, capacities=(1_000, 10_000, 1_000_000)):
+    rng = np.random.default_rng(0)
+    for capacity in capacities:
+        weights = rng.integers(1, capacity // 10, num_items).tolist()
+        profits = rng.integers(1, 1_000, num_items).tolist()
+        start = time.perf_counter()
+        best = is_knapsack_profitable(weights, profits, capacity)
+        line = f"capacity {capacity}: rolling row {time.perf_counter() - start:.3f}s"
+        if num_items * capacity <= 1_000_000:
+            start = time.perf_counter()
+            same = is_knapsack_profitable_table(weights, profits, capacity) == best
+            line += f", table {time.perf_counter() - start:.3f}s (same result: {same})"
+        print(line)
+
+if __name__ == "__main__":
+    # Example usage
+    weights = [1, 2, 3]
+    profits = [6, 10, 12]
+    capacity = 5
+
+    if is_knapsack_profitable(weights, profits, capacity):
+        print("Profitable")
+    else:
+        print("Not profitable")
+
+    benchmark()